@@ -0,0 +1,179 @@
+"""
+Benchmark ROI hand tracking against the full-frame MediaPipe path.
+
+ROI tracking is not wired into MediaPipeExtractor: on the synthetic clip below it
+gave no saving (720p: 26.5 vs 26.9 fps, 1080p: 24.5 vs 25.9 fps, max_side=128:
+22.9 vs 24.9 fps; hands time equal or slightly worse). MediaPipe already resizes to
+fixed model inputs and skips palm detection while tracking. Re-run on a recorded
+signing clip before enabling it anywhere.
+
+Usage:
+    PYTHONPATH=./src python benchmarks/bench_roi.py [--clip clip.npy|clip.mp4] [--frames 300]
+
+Without `--clip`, a synthetic clip is rendered: a skin-toned open hand (palm, four
+fingers, thumb, forearm) drifting and bobbing across a plain background, which
+MediaPipe Hands detects. The synthetic clip has no body, so ROI seeding comes from the
+previous hand boxes only; recorded clips also exercise pose-wrist seeding. Recorded
+clips can be `.npy` arrays shaped [frames, height, width, 3] (RGB uint8) or any video
+OpenCV can decode. Requires mediapipe (and OpenCV, which it installs).
+
+Reports throughput and CPU per frame for both paths, wall time spent in hand
+detection alone (pose runs identically on both paths), ROI counters, and the mean
+distance between hand landmarks found by each path on frames where both found hands.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from unison_io_sign.roi import HandROITracker, ROIConfig
+
+def draw_hand(frame: np.ndarray, cx: float, cy: float, scale: float, color=(198, 150, 120)) -> None:
+    import cv2  # type: ignore  # installed alongside mediapipe
+
+    s = scale
+    cv2.ellipse(frame, (int(cx), int(cy)), (int(55 * s), int(65 * s)), 0, 0, 360, color, -1)
+    for i, (angle, length, width) in enumerate([(-100, 95, 17), (-80, 110, 18), (-62, 105, 17), (-45, 85, 15)]):
+        bx, by = cx + (-36 + i * 24) * s, cy - 50 * s
+        ex = bx + math.cos(math.radians(angle)) * length * s
+        ey = by + math.sin(math.radians(angle)) * length * s
+        cv2.line(frame, (int(bx), int(by)), (int(ex), int(ey)), color, int(width * s * 2))
+        cv2.circle(frame, (int(ex), int(ey)), int(width * s), color, -1)
+    bx, by = cx - 45 * s, cy + 10 * s
+    tx = bx + math.cos(math.radians(-160)) * 80 * s
+    ty = by + math.sin(math.radians(-160)) * 80 * s
+    cv2.line(frame, (int(bx), int(by)), (int(tx), int(ty)), color, int(34 * s))
+    cv2.rectangle(frame, (int(cx - 40 * s), int(cy + 40 * s)), (int(cx + 40 * s), int(cy + 300 * s)), color, -1)
+
+
+def synthetic_clip(count: int, height: int = 720, width: int = 1280) -> List[np.ndarray]:
+    import cv2  # type: ignore
+
+    frames = []
+    for i in range(count):
+        frame = np.full((height, width, 3), (90, 120, 160), dtype=np.uint8)
+        t = i / max(1, count - 1)
+        cx = width * (0.3 + 0.4 * t)
+        cy = height * 0.45 + 20 * math.sin(i / 6.0)
+        draw_hand(frame, cx, cy, scale=1.0)
+        frames.append(cv2.GaussianBlur(frame, (7, 7), 0))
+    return frames
+
+
+def load_clip(path: str, limit: int) -> List[np.ndarray]:
+    if path.endswith(".npy"):
+        return list(np.load(path)[:limit])
+    import cv2  # type: ignore
+
+    capture = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < limit:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    capture.release()
+    return frames
+
+
+class _TimedHands:
+    """Proxy that accumulates time spent in a MediaPipe `Hands.process` call."""
+
+    def __init__(self, hands):
+        self.hands = hands
+        self.seconds = 0.0
+
+    def process(self, image):
+        start = time.perf_counter()
+        try:
+            return self.hands.process(image)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+
+def _video_hands(mp):
+    return _TimedHands(
+        mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=2,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5,
+        )
+    )
+
+
+def run(name: str, frames: List[np.ndarray], roi: Optional[ROIConfig] = None) -> List[Optional[np.ndarray]]:
+    """Pose + hands per frame, as MediaPipeExtractor runs them; returns first-hand xy per frame."""
+    import mediapipe as mp  # type: ignore
+
+    pose = mp.solutions.pose.Pose(
+        static_image_mode=False,
+        model_complexity=0,
+        enable_segmentation=False,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5,
+    )
+    hands = _video_hands(mp)
+    timers = [hands]
+    tracker = HandROITracker(roi) if roi else None
+    crop_hands = None
+    if tracker:
+        crop_hands = _video_hands(mp)
+        timers.append(crop_hands)
+
+    results: List[Optional[np.ndarray]] = []
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    for frame in frames:
+        pose_res = pose.process(frame)
+        if tracker:
+            hand_res = tracker.track(
+                frame, crop_hands.process, pose_landmarks=pose_res.pose_landmarks, detect_full=hands.process
+            )
+        else:
+            hand_res = hands.process(frame)
+        found = hand_res.multi_hand_landmarks
+        results.append(np.array([[pt.x, pt.y] for pt in found[0].landmark]) if found else None)
+    wall = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    print(
+        f"{name:<6} frames={len(frames)} fps={len(frames) / wall:7.1f} "
+        f"cpu_ms/frame={1000 * cpu / len(frames):6.2f} "
+        f"hands_ms/frame={1000 * sum(t.seconds for t in timers) / len(frames):6.2f} "
+        f"frames_with_hands={sum(r is not None for r in results)}"
+    )
+    if tracker:
+        print(f"{'':<6} roi_stats={tracker.stats.to_dict()}")
+    return results
+
+
+def landmark_error(full: List[Optional[np.ndarray]], roi: List[Optional[np.ndarray]]) -> Optional[float]:
+    errors = [
+        float(np.mean(np.linalg.norm(a - b, axis=1))) for a, b in zip(full, roi) if a is not None and b is not None
+    ]
+    return float(np.mean(errors)) if errors else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clip", help="recorded clip (.npy or video file)")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--max-side", type=int, default=256)
+    args = parser.parse_args()
+
+    frames = load_clip(args.clip, args.frames) if args.clip else synthetic_clip(args.frames)
+    print(f"clip={args.clip or 'synthetic'} shape={frames[0].shape if frames else None}")
+    full = run("full", frames)
+    roi = run("roi", frames, roi=ROIConfig(max_side=args.max_side))
+    error = landmark_error(full, roi)
+    if error is not None:
+        print(f"mean hand landmark distance roi vs full (normalized xy): {error:.4f}")
+
+
+if __name__ == "__main__":
+    main()
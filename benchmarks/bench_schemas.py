@@ -0,0 +1,65 @@
+"""
+Microbenchmark for schema construction on the interpretation hot path.
+
+Usage:
+    PYTHONPATH=./src python benchmarks/bench_schemas.py [--count 200000]
+
+Reports objects/s and net bytes allocated per object (tracemalloc) for each path.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable
+
+from unison_io_sign.schemas import SignInterpretation, SignPresenceEvent, VideoSegment, format_timestamp
+
+
+def measure(name: str, make: Callable[[], object], count: int) -> None:
+    start = time.perf_counter()
+    for _ in range(count):
+        make()
+    elapsed = time.perf_counter() - start
+
+    # keep objects alive while tracing so their size is counted
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = [make() for _ in range(min(count, 10000))]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_object = (after - before) / len(kept)
+    print(f"{name:<32} {count / elapsed:>12,.0f} obj/s {per_object:>9.1f} B/obj")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=200000)
+    args = parser.parse_args()
+
+    segment = VideoSegment(frames=[None] * 8)
+    interp = SignInterpretation.from_stub(language="asl", text="open settings", gloss=["OPEN", "SETTINGS"])
+
+    measure("from_stub (no segment)", lambda: SignInterpretation.from_stub(language="asl", text="hi"), args.count)
+    measure(
+        "from_stub (segment)",
+        lambda: SignInterpretation.from_stub(language="asl", text="hi", segment=segment),
+        args.count,
+    )
+    measure("VideoSegment()", VideoSegment, args.count)
+    measure("SignInterpretation.to_dict", interp.to_dict, args.count)
+    measure(
+        "SignPresenceEvent",
+        lambda: SignPresenceEvent(
+            event_type="sign_presence_detected",
+            timestamp=format_timestamp(),
+            source="bench",
+            confidence=0.9,
+        ),
+        args.count,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ from .schemas import (
 from .provider import SignLanguageProvider, register_provider, get_provider
 from .detector import SignPresenceDetector, DetectionConfig
 from .interpreter import SignInterpreter, InterpreterConfig
+from .scheduler import SessionScheduler, SchedulerConfig
 
 __all__ = [
     "AvatarInstructions",
@@ -22,4 +23,6 @@ __all__ = [
     "DetectionConfig",
     "SignInterpreter",
     "InterpreterConfig",
+    "SessionScheduler",
+    "SchedulerConfig",
 ]
@@ -0,0 +1,143 @@
+"""
+Result cache for repeated segments.
+
+Kiosk users repeat a small set of commands, so near-identical keypoint tensors keep
+reaching the classifier. The cache keys each tensor by a locality-sensitive
+fingerprint (random-hyperplane SimHash over quantized features) plus the model
+version, confirms candidates by RMS distance between the raw feature tensors, and
+evicts least-recently-used entries to stay within a byte budget. The hash only picks
+candidate buckets; a scaled or shifted tensor with the same direction can share a
+bucket but fails the distance check.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+Prediction = Tuple[str, float, List[str]]
+
+
+@dataclass
+class CacheConfig:
+    max_bytes: int = 4 * 1024 * 1024
+    max_distance: float = 0.01  # RMS feature difference allowed when reusing a result
+    quantum: float = 0.01  # feature quantization step before hashing
+    hash_bits: int = 16
+    seed: int = 0
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class PredictionCache:
+    _MAX_PLANE_SETS = 8
+
+    def __init__(self, config: Optional[CacheConfig] = None):
+        self.config = config or CacheConfig()
+        self.stats = CacheStats()
+        # entry id -> (bucket key, vector, prediction, nbytes), in LRU order
+        self._entries: "OrderedDict[int, Tuple[tuple, np.ndarray, Prediction, int]]" = OrderedDict()
+        self._buckets: Dict[tuple, List[int]] = {}
+        self._planes: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._next_id = 0
+        # one cache serves every session's classifier calls on the router's threads
+        self._lock = threading.Lock()
+
+    def _hyperplanes(self, dim: int) -> np.ndarray:
+        planes = self._planes.get(dim)
+        if planes is None:
+            rng = np.random.default_rng((self.config.seed, dim))
+            planes = rng.standard_normal((self.config.hash_bits, dim)).astype(np.float32)
+            self._planes[dim] = planes
+            if len(self._planes) > self._MAX_PLANE_SETS:
+                self._planes.popitem(last=False)
+        else:
+            self._planes.move_to_end(dim)
+        return planes
+
+    def _vector(self, features: np.ndarray) -> np.ndarray:
+        return np.asarray(features, dtype=np.float32).ravel()
+
+    def _bits(self, vector: np.ndarray) -> int:
+        quantized = np.round(vector / self.config.quantum) * self.config.quantum
+        projections = self._hyperplanes(vector.shape[0]) @ quantized.astype(np.float32)
+        bits = 0
+        for bit, value in enumerate(projections):
+            if value >= 0:
+                bits |= 1 << bit
+        return bits
+
+    @staticmethod
+    def _distance(a: np.ndarray, b: np.ndarray) -> float:
+        return float(np.sqrt(np.mean(np.square(a - b))))
+
+    def lookup(self, model_version: str, features: np.ndarray) -> Optional[Prediction]:
+        vector = self._vector(features)
+        with self._lock:
+            bits = self._bits(vector)
+            # probe the exact bucket, then buckets one bit away (near-identical
+            # vectors can straddle a hyperplane)
+            probes = [bits] + [bits ^ (1 << bit) for bit in range(self.config.hash_bits)]
+            for probe in probes:
+                for entry_id in self._buckets.get((model_version, vector.shape[0], probe), ()):
+                    _, stored, prediction, _ = self._entries[entry_id]
+                    if self._distance(vector, stored) <= self.config.max_distance:
+                        self._entries.move_to_end(entry_id)
+                        self.stats.hits += 1
+                        text, confidence, gloss = prediction
+                        return text, confidence, list(gloss)
+            self.stats.misses += 1
+            return None
+
+    def store(self, model_version: str, features: np.ndarray, prediction: Prediction) -> None:
+        vector = self._vector(features)
+        text, confidence, gloss = prediction
+        nbytes = vector.nbytes + len(text) + sum(len(g) for g in gloss) + 64
+        if nbytes > self.config.max_bytes:
+            return
+        with self._lock:
+            key = (model_version, vector.shape[0], self._bits(vector))
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (key, vector, (text, confidence, list(gloss)), nbytes)
+            self._buckets.setdefault(key, []).append(entry_id)
+            self.stats.entries += 1
+            self.stats.bytes += nbytes
+            while self.stats.bytes > self.config.max_bytes:
+                self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        entry_id, (key, _, _, nbytes) = self._entries.popitem(last=False)
+        bucket = self._buckets[key]
+        bucket.remove(entry_id)
+        if not bucket:
+            del self._buckets[key]
+        self.stats.entries -= 1
+        self.stats.bytes -= nbytes
+        self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self.stats.entries = 0
+            self.stats.bytes = 0
@@ -2,9 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Iterable, List, Protocol
-import time
 
-from .schemas import SignPresenceEvent
+from .schemas import SignPresenceEvent, format_timestamp
 
 
 class Frame(Protocol):
@@ -37,10 +36,9 @@ class SignPresenceDetector:
         self._buffer: List[Frame] = []
 
     def _emit_event(self, event_type: str, confidence: float) -> SignPresenceEvent:
-        ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
         return SignPresenceEvent(
             event_type=event_type,
-            timestamp=ts,
+            timestamp=format_timestamp(),
             source=self.config.source,
             language_hint=self.config.language_hint,
             confidence=confidence,
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Iterable, List, Optional
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Callable, Deque, Iterable, List, Optional, Tuple
+import time
 
 from .schemas import SignInterpretation, VideoSegment
 from .provider import SignLanguageProvider
 
 
+def _monotonic_ms() -> float:
+    return time.monotonic() * 1000.0
+
+
 @dataclass
 class InterpreterConfig:
     segment_size: int = 8  # frames per segment for Phase 1 stub
     language_code: str = "asl"
+    max_buffered_frames: Optional[int] = None  # per-session budget for buffered + pending frames
+    deadline_ms: Optional[float] = None  # max age of a segment's first frame when its result lands
+
+
+@dataclass
+class InterpreterStats:
+    segments_interpreted: int = 0
+    shed_frames: int = 0  # frames dropped by the budget or as part of stale segments
+    shed_segments: int = 0
+    deadline_misses: int = 0  # segments dropped as stale or whose result landed late
+
+    def to_dict(self) -> dict:
+        return asdict(self)
 
 
 class SignInterpreter:
@@ -18,29 +37,137 @@ class SignInterpreter:
     Segmentation + provider wiring skeleton.
 
     Phase 1: batches frames into fixed-size segments and calls the configured provider.
+
+    Segments are queued before interpretation so a slow provider cannot grow memory
+    without bound: `max_buffered_frames` sheds the oldest queued segments once the
+    session is over budget (this can empty the queue), and `deadline_ms` skips queued
+    segments that are already older than the deadline when their turn comes. The
+    deadline check never skips the newest queued segment, so a backlog degrades to the
+    latest signing rather than to silence. Without either setting, behavior is
+    unchanged.
+
+    `close_stream()` marks the end of a signing stream. Before the first segment of
+    each stream is interpreted, the provider's `reset_stream()` (if it has one) is
+    called so keypoint state does not carry over from the previous stream.
     """
 
-    def __init__(self, provider: SignLanguageProvider, config: Optional[InterpreterConfig] = None):
+    def __init__(
+        self,
+        provider: SignLanguageProvider,
+        config: Optional[InterpreterConfig] = None,
+        clock: Optional[Callable[[], float]] = None,
+    ):
         self.provider = provider
         self.config = config or InterpreterConfig()
+        budget = self.config.max_buffered_frames
+        if budget is not None and budget < self.config.segment_size:
+            raise ValueError(
+                f"max_buffered_frames ({budget}) must be at least segment_size ({self.config.segment_size})"
+            )
+        self.stats = InterpreterStats()
+        self._clock = clock or _monotonic_ms
         self._buffer: List[object] = []
+        self._buffer_started_ms: Optional[float] = None
+        self._pending: Deque[Tuple[float, int, VideoSegment]] = deque()  # (arrived_ms, stream, segment)
+        self._pending_frames = 0
+        self._stream = 0
+        self._served_stream: Optional[int] = None
+
+    @property
+    def pending_frames(self) -> int:
+        """Frames held by this session, buffered or queued for interpretation."""
+        return len(self._buffer) + self._pending_frames
+
+    @property
+    def pending_segments(self) -> int:
+        return len(self._pending)
+
+    def oldest_arrival_ms(self) -> Optional[float]:
+        return self._pending[0][0] if self._pending else None
+
+    def next_deadline_ms(self) -> Optional[float]:
+        if not self._pending or self.config.deadline_ms is None:
+            return None
+        return self._pending[0][0] + self.config.deadline_ms
 
     def ingest_frames(self, frames: Iterable[object]) -> List[SignInterpretation]:
-        interpretations: List[SignInterpretation] = []
+        self.enqueue_frames(frames)
+        return self.interpret_pending()
+
+    def enqueue_frames(self, frames: Iterable[object]) -> None:
+        """Buffer frames and queue full segments without calling the provider."""
         for frame in frames:
+            if not self._buffer:
+                self._buffer_started_ms = self._clock()
             self._buffer.append(frame)
             if len(self._buffer) >= self.config.segment_size:
-                segment = self._flush_segment()
-                interp = self.provider.interpret_segment(segment)
-                interpretations.append(interp)
+                self._queue_segment()
+            budget = self.config.max_buffered_frames
+            while budget is not None and self.pending_frames > budget and self.shed_oldest():
+                pass
+
+    def interpret_pending(self, max_segments: Optional[int] = None) -> List[SignInterpretation]:
+        """
+        Interpret queued segments oldest first, dropping stale ones except the newest.
+        `max_segments` bounds how many are interpreted in this call.
+        """
+        interpretations: List[SignInterpretation] = []
+        while self._pending and (max_segments is None or len(interpretations) < max_segments):
+            arrived_ms, stream, segment = self._pending.popleft()
+            frame_count = len(segment.frames or [])
+            self._pending_frames -= frame_count
+            deadline = self.config.deadline_ms
+            started = self._clock()
+            if deadline is not None and self._pending and started - arrived_ms > deadline:
+                self.stats.deadline_misses += 1
+                self.stats.shed_segments += 1
+                self.stats.shed_frames += frame_count
+                continue
+            if stream != self._served_stream:
+                self._served_stream = stream
+                reset_stream = getattr(self.provider, "reset_stream", None)
+                if reset_stream is not None:
+                    reset_stream()
+            interp = self.provider.interpret_segment(segment)
+            finished = self._clock()
+            if deadline is not None and finished - arrived_ms > deadline:
+                self.stats.deadline_misses += 1
+            self.stats.segments_interpreted += 1
+            interpretations.append(interp)
         return interpretations
 
+    def close_segment(self) -> None:
+        """Queue any residual frames as one last segment without interpreting it."""
+        if self._buffer:
+            self._queue_segment()
+
+    def close_stream(self) -> None:
+        """End the current stream: queue residual frames; later frames start a new one."""
+        self.close_segment()
+        self._stream += 1
+
     def flush(self) -> List[SignInterpretation]:
         """Flush any residual frames into one last segment if present."""
-        if not self._buffer:
-            return []
+        self.close_segment()
+        return self.interpret_pending()
+
+    def shed_oldest(self) -> int:
+        """Drop the oldest queued segment; returns frames shed (0 if nothing is queued)."""
+        if not self._pending:
+            return 0
+        _, _, segment = self._pending.popleft()
+        count = len(segment.frames or [])
+        self._pending_frames -= count
+        self.stats.shed_segments += 1
+        self.stats.shed_frames += count
+        return count
+
+    def _queue_segment(self) -> None:
+        arrived_ms = self._buffer_started_ms if self._buffer_started_ms is not None else self._clock()
         segment = self._flush_segment()
-        return [self.provider.interpret_segment(segment)]
+        self._pending.append((arrived_ms, self._stream, segment))
+        self._pending_frames += len(segment.frames or [])
+        self._buffer_started_ms = None
 
     def _flush_segment(self) -> VideoSegment:
         frames = list(self._buffer)
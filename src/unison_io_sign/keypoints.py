@@ -10,6 +10,8 @@ fallback to a no-op extractor when dependencies are unavailable.
 from dataclasses import dataclass, field
 from typing import Any, List, Literal, Optional
 
+from .sampling import AdaptiveFrameSampler, SamplingConfig
+
 
 @dataclass
 class KeypointResult:
@@ -22,13 +24,22 @@ class _NoOpExtractor:
     def extract(self, frames: List[Any]) -> KeypointResult:
         return KeypointResult(hand_landmarks=[], body_landmarks=[], frame_features=[])
 
+    def reset(self) -> None:
+        pass
+
 
 class MediaPipeExtractor:
     """
     Thin wrapper to avoid hard dependency failures when mediapipe is absent.
+
+    Pass a `SamplingConfig` to skip hands + pose on low-motion frames; skipped
+    frames get interpolated `frame_features` and are counted in `sampling_stats`.
+
+    The sampler and MediaPipe's video-mode trackers carry state from one `extract()`
+    call to the next; call `reset()` when a new stream starts.
     """
 
-    def __init__(self):
+    def __init__(self, sampling: Optional[SamplingConfig] = None):
         try:
             import mediapipe as mp  # type: ignore
         except Exception as exc:  # pragma: no cover - environment-specific
@@ -47,13 +58,23 @@ class MediaPipeExtractor:
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5,
         )
+        self._sampler = AdaptiveFrameSampler(sampling) if sampling else None
+
+    @property
+    def sampling_stats(self):
+        return self._sampler.stats if self._sampler else None
+
+    def reset(self) -> None:
+        if self._sampler:
+            self._sampler.reset()
+        self._hands.reset()
+        self._pose.reset()
 
     def extract(self, frames: List[Any]) -> KeypointResult:
         # Note: frames are assumed to be RGB images (numpy arrays). In Phase 2,
         # tests use empty frames; this path will be used once real frames are passed.
         hand_landmarks = []
         body_landmarks = []
-        frame_features: List[List[float]] = []
 
         def _flatten_landmarks(lms) -> List[float]:
             flat: List[float] = []
@@ -63,24 +84,32 @@ class MediaPipeExtractor:
                         flat.extend([float(pt.x), float(pt.y), float(pt.z)])
             return flat
 
-        for frame in frames:
-            hand_res = self._hands.process(frame)
+        def _process(frame) -> List[float]:
             pose_res = self._pose.process(frame)
+            hand_res = self._hands.process(frame)
             if hand_res.multi_hand_landmarks:
                 hand_landmarks.extend(hand_res.multi_hand_landmarks)
             if pose_res.pose_landmarks:
                 body_landmarks.append(pose_res.pose_landmarks)
             hands_flat = _flatten_landmarks(hand_res.multi_hand_landmarks) if hand_res else []
             body_flat = _flatten_landmarks([pose_res.pose_landmarks]) if pose_res and pose_res.pose_landmarks else []
-            frame_features.append(hands_flat + body_flat)
+            return hands_flat + body_flat
+
+        if self._sampler:
+            frame_features = self._sampler.sample(list(frames), _process)
+        else:
+            frame_features = [_process(frame) for frame in frames]
 
         return KeypointResult(hand_landmarks=hand_landmarks, body_landmarks=body_landmarks, frame_features=frame_features)
 
 
-def make_extractor(backend: Optional[Literal["mediapipe"]] = "mediapipe"):
+def make_extractor(
+    backend: Optional[Literal["mediapipe"]] = "mediapipe",
+    sampling: Optional[SamplingConfig] = None,
+):
     if backend == "mediapipe":
         try:
-            return MediaPipeExtractor()
+            return MediaPipeExtractor(sampling=sampling)
         except Exception:
             return _NoOpExtractor()
     return _NoOpExtractor()
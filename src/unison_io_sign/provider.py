@@ -4,10 +4,16 @@ Provider abstraction for sign-language interpretation and signing output.
 
 from __future__ import annotations
 
-from typing import Dict, Protocol
+import logging
+import os
+from typing import Callable, Dict, Optional, Protocol, TypeVar
 
 from .schemas import SignInterpretation, SigningOutput, VideoSegment
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
 
 class SignLanguageProvider(Protocol):
     @property
@@ -36,3 +42,34 @@ def get_provider(language_code: str) -> SignLanguageProvider:
     if language_code not in _PROVIDERS:
         raise KeyError(f"No provider registered for language: {language_code}")
     return _PROVIDERS[language_code]
+
+
+def language_env(name: str, language: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve `{name}_{LANG}` with a fallback to the generic `{name}` setting.
+    """
+    return os.getenv(f"{name}_{language.upper()}") or os.getenv(name, default)
+
+
+def parse_flag(value: str) -> bool:
+    normalized = value.strip().lower()
+    if normalized in ("1", "true", "yes", "on"):
+        return True
+    if normalized in ("0", "false", "no", "off", ""):
+        return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+
+def language_env_value(name: str, language: str, parse: Callable[[str], T], default: T) -> T:
+    """
+    Parse a per-language setting, logging and falling back to `default` when the
+    value is missing or malformed so a typo cannot break provider construction.
+    """
+    raw = language_env(name, language)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return parse(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r for %s; using %r", name, raw, language, default)
+        return default
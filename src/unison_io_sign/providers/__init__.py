@@ -1,3 +1,4 @@
 from .asl import ASLProvider
+from .router import ClassifierPool, LanguageRouter, RouterConfig
 
-__all__ = ["ASLProvider"]
+__all__ = ["ASLProvider", "ClassifierPool", "LanguageRouter", "RouterConfig"]
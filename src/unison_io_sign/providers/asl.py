@@ -3,12 +3,39 @@ from __future__ import annotations
 import os
 from typing import List, Optional
 
-from ..provider import SignLanguageProvider
+from ..provider import SignLanguageProvider, language_env, language_env_value, parse_flag
 from ..schemas import SignInterpretation, SigningOutput, VideoSegment, AvatarInstructions
+from ..cache import CacheConfig, PredictionCache
 from ..keypoints import make_extractor, KeypointResult
+from ..sampling import SamplingConfig
 from ..wlasl_classifier import WLASLClassifier
 
 
+def sampling_from_env(language: str) -> Optional[SamplingConfig]:
+    # adaptive frame sampling is opt-in via a max stride > 1
+    stride = language_env_value("UNISON_SIGN_SAMPLING_MAX_STRIDE", language, int, 1)
+    return SamplingConfig(max_stride=stride) if stride > 1 else None
+
+
+def cache_from_env(language: str) -> Optional[PredictionCache]:
+    # result cache is opt-in via a memory budget in MB
+    budget_mb = language_env_value("UNISON_SIGN_RESULT_CACHE_MB", language, float, 0.0)
+    return PredictionCache(CacheConfig(max_bytes=int(budget_mb * 1024 * 1024))) if budget_mb > 0 else None
+
+
+def make_classifier(model_path: str, language: str) -> WLASLClassifier:
+    labels_path = language_env("UNISON_SIGN_LABELS_PATH", language)
+    cache = cache_from_env(language)
+    # variant auto-selection is opt-in and needs a held-out keypoint set
+    holdout_dir = language_env("UNISON_SIGN_HOLDOUT_DIR", language)
+    if language_env_value("UNISON_SIGN_MODEL_AUTOSELECT", language, parse_flag, False):
+        tolerance = language_env_value("UNISON_SIGN_MODEL_TOLERANCE", language, float, 0.01)
+        return WLASLClassifier.from_variants(
+            model_path, holdout_dir=holdout_dir, tolerance=tolerance, labels_path=labels_path, cache=cache
+        )
+    return WLASLClassifier(model_path, labels_path=labels_path, cache=cache)
+
+
 class ASLProvider(SignLanguageProvider):
     """
     ASL provider skeleton.
@@ -23,27 +50,18 @@ class ASLProvider(SignLanguageProvider):
 
     def __init__(self, extractor=None, classifier=None):
         language = os.getenv("UNISON_SIGN_LANGUAGE", "asl").lower()
-        # resolve model path with per-language override then generic fallback
-        lang_path = os.getenv(f"UNISON_SIGN_MODEL_PATH_{language.upper()}")
-        generic_path = os.getenv("UNISON_SIGN_MODEL_PATH")
-        self.model_path = lang_path or generic_path
-
-        # resolve backend with per-language override then generic fallback
-        lang_backend = os.getenv(f"UNISON_SIGN_KEYPOINT_BACKEND_{language.upper()}")
-        generic_backend = os.getenv("UNISON_SIGN_KEYPOINT_BACKEND", "mediapipe")
-        self.backend = lang_backend or generic_backend
-
-        # resolve labels path with per-language override then generic fallback
-        lang_labels = os.getenv(f"UNISON_SIGN_LABELS_PATH_{language.upper()}")
-        generic_labels = os.getenv("UNISON_SIGN_LABELS_PATH")
-        self.labels_path = lang_labels or generic_labels
+        # each setting resolves a per-language override then the generic fallback
+        self.model_path = language_env("UNISON_SIGN_MODEL_PATH", language)
+        self.backend = language_env("UNISON_SIGN_KEYPOINT_BACKEND", language, "mediapipe")
+        self.labels_path = language_env("UNISON_SIGN_LABELS_PATH", language)
+        self.sampling = sampling_from_env(language)
 
         self.extractor = extractor
         self.classifier = classifier
         if self.model_path and self.classifier is None:
-            self.classifier = WLASLClassifier(self.model_path, labels_path=self.labels_path)
+            self.classifier = make_classifier(self.model_path, language)
         if self.extractor is None:
-            self.extractor = make_extractor(self.backend)
+            self.extractor = make_extractor(self.backend, sampling=self.sampling)
 
     @property
     def language_code(self) -> str:
@@ -65,6 +83,12 @@ class ASLProvider(SignLanguageProvider):
             segment=segment,
         )
 
+    def reset_stream(self) -> None:
+        """Forget keypoint state carried over from the previous stream."""
+        reset = getattr(self.extractor, "reset", None)
+        if reset is not None:
+            reset()
+
     def generate_output(self, text: str, gloss: Optional[List[str]] = None) -> SigningOutput:
         return SigningOutput(
             language=self.language_code,
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..provider import SignLanguageProvider, language_env
+from ..schemas import SignInterpretation, SigningOutput, VideoSegment, AvatarInstructions
+from ..keypoints import make_extractor, KeypointResult
+from .asl import make_classifier, sampling_from_env
+
+
+@dataclass
+class RouterConfig:
+    pin_confidence: float = 0.8  # a win at or above this counts toward pinning
+    pin_segments: int = 3  # consecutive confident wins by one language before pinning
+
+
+class ClassifierPool:
+    """
+    Language classifiers and the fan-out executor shared by every session's
+    `LanguageRouter`. Models are loaded once per process; call `close()` (or use the
+    pool as a context manager) to stop the executor threads.
+
+    Keypoint extractors keep per-stream state (frame sampler, MediaPipe trackers), so
+    each router gets its own from `extractor_factory`.
+    """
+
+    def __init__(
+        self,
+        classifiers: Dict[str, Any],
+        extractor_factory: Optional[Callable[[], Any]] = None,
+        languages: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,  # defaults to one worker per language
+    ):
+        self.classifiers = classifiers
+        self.extractor_factory = extractor_factory or partial(make_extractor, "mediapipe")
+        self.languages = languages or list(classifiers) or ["asl"]
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(
+        cls, extractor_factory: Optional[Callable[[], Any]] = None, languages: Optional[List[str]] = None
+    ) -> "ClassifierPool":
+        """
+        Build classifiers for `UNISON_SIGN_LANGUAGES` (comma separated, default "asl").
+        Each language loads `UNISON_SIGN_MODEL_PATH_{LANG}`; the generic
+        `UNISON_SIGN_MODEL_PATH` only applies to the first language, and languages
+        without a model of their own are skipped.
+        """
+        if languages is None:
+            raw = os.getenv("UNISON_SIGN_LANGUAGES", "asl")
+            languages = [lang.strip().lower() for lang in raw.split(",") if lang.strip()]
+        classifiers: Dict[str, Any] = {}
+        for index, language in enumerate(languages):
+            model_path = os.getenv(f"UNISON_SIGN_MODEL_PATH_{language.upper()}")
+            if not model_path and index == 0:
+                model_path = os.getenv("UNISON_SIGN_MODEL_PATH")
+            if model_path:
+                classifiers[language] = make_classifier(model_path, language)
+        if extractor_factory is None:
+            primary = languages[0] if languages else "asl"
+            extractor_factory = partial(
+                make_extractor,
+                language_env("UNISON_SIGN_KEYPOINT_BACKEND", primary, "mediapipe"),
+                sampling=sampling_from_env(primary),
+            )
+        return cls(classifiers, extractor_factory=extractor_factory, languages=languages)
+
+    def loaded_languages(self) -> List[str]:
+        ordered = [lang for lang in self.languages if lang in self.classifiers]
+        ordered += [lang for lang in self.classifiers if lang not in ordered]
+        return [lang for lang in ordered if getattr(self.classifiers[lang], "loaded", False)]
+
+    def predict(
+        self, languages: List[str], keypoints: KeypointResult, hint_text: Optional[str]
+    ) -> Dict[str, Tuple[str, float, List[str]]]:
+        if len(languages) == 1:
+            lang = languages[0]
+            return {lang: self.classifiers[lang].predict(keypoints, hint_text=hint_text)}
+        with self._lock:
+            if self._executor is None:
+                workers = self.max_workers or len(self.classifiers)
+                self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="sign-router")
+            executor = self._executor
+        futures = {
+            lang: executor.submit(self.classifiers[lang].predict, keypoints, hint_text=hint_text) for lang in languages
+        }
+        return {lang: future.result() for lang, future in futures.items()}
+
+    def router(self, config: Optional[RouterConfig] = None) -> "LanguageRouter":
+        return LanguageRouter(self, config)
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ClassifierPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class LanguageRouter(SignLanguageProvider):
+    """
+    Provider for sessions whose sign language is not known up front.
+
+    Keypoints are extracted once per segment and fanned out to every loaded language
+    classifier in the shared pool concurrently (ONNX Runtime releases the GIL while
+    running). The best-scoring language wins the segment. Once the same language wins
+    `pin_segments` times in a row with confidence >= `pin_confidence`, the router pins
+    the session to it and later segments run a single model. Create one router per
+    session with `pool.router()`; each has its own keypoint extractor. Call `reset()`
+    when the signer changes.
+    """
+
+    def __init__(self, pool: ClassifierPool, config: Optional[RouterConfig] = None):
+        self.pool = pool
+        self.config = config or RouterConfig()
+        self.extractor = pool.extractor_factory()
+        self._pinned: Optional[str] = None
+        self._streak_language: Optional[str] = None
+        self._streak = 0
+
+    @property
+    def language_code(self) -> str:
+        return self._pinned or "auto"
+
+    @property
+    def pinned_language(self) -> Optional[str]:
+        return self._pinned
+
+    def reset(self) -> None:
+        self._pinned = None
+        self._streak_language = None
+        self._streak = 0
+        self.reset_stream()
+
+    def reset_stream(self) -> None:
+        reset = getattr(self.extractor, "reset", None)
+        if reset is not None:
+            reset()
+
+    def _update_pin(self, language: str, confidence: float) -> None:
+        if confidence < self.config.pin_confidence:
+            self._streak_language = None
+            self._streak = 0
+            return
+        if language == self._streak_language:
+            self._streak += 1
+        else:
+            self._streak_language = language
+            self._streak = 1
+        if self._streak >= self.config.pin_segments:
+            self._pinned = language
+
+    def interpret_segment(self, segment: VideoSegment) -> SignInterpretation:
+        hint_text = segment.metadata.get("text_hint") if segment.metadata else None
+        languages = [self._pinned] if self._pinned else self.pool.loaded_languages()
+        if not languages:
+            return SignInterpretation.from_stub(
+                language=self.pool.languages[0],
+                text=hint_text or "",
+                intent=None,
+                confidence=0.75 if hint_text else 0.2,
+                gloss=[],
+                segment=segment,
+            )
+
+        frames = segment.frames or []
+        keypoints: KeypointResult = self.extractor.extract(frames) if self.extractor else KeypointResult([], [])
+        results = self.pool.predict(languages, keypoints, hint_text)
+        # ties keep configured language order
+        best = max(languages, key=lambda lang: results[lang][1])
+        text, confidence, gloss = results[best]
+        was_pinned = self._pinned is not None
+        if not was_pinned:
+            self._update_pin(best, confidence)
+
+        interp = SignInterpretation.from_stub(
+            language=best,
+            text=text,
+            intent=None,
+            confidence=confidence,
+            gloss=gloss,
+            segment=segment,
+        )
+        interp.metadata["router"] = {
+            "pinned": was_pinned,
+            "scores": {lang: results[lang][1] for lang in languages},
+        }
+        return interp
+
+    def generate_output(self, text: str, gloss: Optional[List[str]] = None) -> SigningOutput:
+        language = self._pinned or self.pool.languages[0]
+        return SigningOutput(
+            language=language,
+            text=text,
+            gloss=gloss or [],
+            avatar_instructions=AvatarInstructions(),
+        )
@@ -0,0 +1,220 @@
+"""
+INT8 model variants for CPU-only edge nodes.
+
+Tooling:
+    python -m unison_io_sign.quantization quantize --model model.onnx --mode dynamic
+    python -m unison_io_sign.quantization quantize --model model.onnx --mode static --calibration-dir fixtures/
+    python -m unison_io_sign.quantization select --model model.onnx --holdout-dir holdout/
+
+Variants are written next to the FP32 model as `<stem>.<variant>.onnx` (for example
+`wlasl.int8-dynamic.onnx`); any sibling following that naming, such as an externally
+pruned `wlasl.pruned.onnx`, is picked up by `discover_variants`. Keypoint fixtures are
+JSON files shaped like `{"frames": [[...], ...], "label": 1}`; `label` is optional.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .keypoints import KeypointResult
+from .wlasl_classifier import keypoints_to_features
+
+try:
+    import onnxruntime as ort  # type: ignore
+except Exception:  # pragma: no cover - optional dependency in some environments
+    ort = None
+
+QUANTIZATION_MODES = ("dynamic", "static")
+
+
+@dataclass
+class KeypointSample:
+    features: np.ndarray
+    label: Optional[int] = None
+
+
+@dataclass
+class VariantReport:
+    name: str
+    path: str
+    latency_ms: float
+    accuracy: float
+    selected: bool = False
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def load_keypoint_samples(directory: str) -> List[KeypointSample]:
+    samples: List[KeypointSample] = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        with open(path, "r") as f:
+            data = json.load(f)
+        if "frames" not in data:
+            continue
+        keypoints = KeypointResult(hand_landmarks=[], body_landmarks=[], frame_features=data["frames"])
+        label = data.get("label")
+        samples.append(KeypointSample(keypoints_to_features(keypoints), int(label) if label is not None else None))
+    return samples
+
+
+def variant_path(model_path: str, variant: str) -> str:
+    stem, ext = os.path.splitext(model_path)
+    return f"{stem}.{variant}{ext or '.onnx'}"
+
+
+def discover_variants(model_path: str) -> Dict[str, str]:
+    """Map variant name -> path, starting with the FP32 model itself."""
+    variants = {"fp32": model_path}
+    stem, ext = os.path.splitext(model_path)
+    for path in sorted(glob.glob(f"{glob.escape(stem)}.*{ext or '.onnx'}")):
+        name = path[len(stem) + 1 : len(path) - len(ext or ".onnx")]
+        if name and "." not in name:
+            variants[name] = path
+    return variants
+
+
+def _calibration_reader(input_name: str, samples: List[KeypointSample]):
+    from onnxruntime.quantization import CalibrationDataReader  # type: ignore
+
+    class KeypointCalibrationReader(CalibrationDataReader):
+        def __init__(self):
+            self._iter: Iterator[KeypointSample] = iter(samples)
+
+        def get_next(self):
+            sample = next(self._iter, None)
+            return {input_name: sample.features} if sample is not None else None
+
+    return KeypointCalibrationReader()
+
+
+def quantize_model(
+    model_path: str,
+    mode: str = "dynamic",
+    output_path: Optional[str] = None,
+    calibration_dir: Optional[str] = None,
+) -> str:
+    """
+    Write an INT8 variant of `model_path` and return its path. Static quantization
+    calibrates activations on the keypoint fixtures in `calibration_dir`.
+    """
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(f"Unknown quantization mode: {mode}")
+    if ort is None:
+        raise RuntimeError("onnxruntime is required for quantization")
+    from onnxruntime.quantization import QuantType, quantize_dynamic, quantize_static  # type: ignore
+
+    output_path = output_path or variant_path(model_path, f"int8-{mode}")
+    if mode == "dynamic":
+        quantize_dynamic(model_path, output_path, weight_type=QuantType.QInt8)
+        return output_path
+
+    if not calibration_dir:
+        raise ValueError("static quantization requires a calibration directory")
+    samples = load_keypoint_samples(calibration_dir)
+    if not samples:
+        raise ValueError(f"No keypoint fixtures found in {calibration_dir}")
+    session = ort.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+    reader = _calibration_reader(session.get_inputs()[0].name, samples)
+    quantize_static(
+        model_path,
+        output_path,
+        reader,
+        activation_type=QuantType.QInt8,
+        weight_type=QuantType.QInt8,
+    )
+    return output_path
+
+
+def _run_variant(session: Any, samples: List[KeypointSample], repeats: int) -> Tuple[List[int], float]:
+    input_name = session.get_inputs()[0].name
+    predictions: List[int] = []
+    for sample in samples:  # warm-up pass also collects predictions
+        scores = np.asarray(session.run(None, {input_name: sample.features})[0]).squeeze()
+        predictions.append(int(np.argmax(scores)) if scores.ndim >= 1 else 0)
+    timings: List[float] = []
+    for _ in range(max(1, repeats)):
+        for sample in samples:
+            start = time.perf_counter()
+            session.run(None, {input_name: sample.features})
+            timings.append((time.perf_counter() - start) * 1000.0)
+    return predictions, statistics.median(timings)
+
+
+def benchmark_variants(
+    model_path: str,
+    holdout: List[KeypointSample],
+    tolerance: float = 0.01,
+    repeats: int = 10,
+) -> Tuple[str, List[VariantReport]]:
+    """
+    Benchmark every variant of `model_path` on `holdout` and return the path of the
+    fastest one whose accuracy is within `tolerance` of FP32, plus per-variant reports.
+
+    Accuracy is measured against sample labels when every sample has one, otherwise as
+    argmax agreement with the FP32 model.
+    """
+    if ort is None or not holdout:
+        return model_path, []
+    labelled = all(sample.label is not None for sample in holdout)
+    reports: List[VariantReport] = []
+    reference: Optional[List[int]] = None
+    baseline_accuracy = 1.0
+    for name, path in discover_variants(model_path).items():
+        try:
+            session = ort.InferenceSession(path, providers=["CPUExecutionProvider"])
+            predictions, latency = _run_variant(session, holdout, repeats)
+        except Exception:
+            continue
+        if reference is None:
+            reference = [s.label for s in holdout] if labelled else predictions  # type: ignore[misc]
+        accuracy = sum(p == r for p, r in zip(predictions, reference)) / len(holdout)
+        if name == "fp32":
+            baseline_accuracy = accuracy
+        reports.append(VariantReport(name=name, path=path, latency_ms=latency, accuracy=accuracy))
+
+    eligible = [r for r in reports if r.accuracy >= baseline_accuracy - tolerance]
+    if not eligible:
+        return model_path, reports
+    best = min(eligible, key=lambda r: r.latency_ms)
+    best.selected = True
+    return best.path, reports
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m unison_io_sign.quantization")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    quant = sub.add_parser("quantize", help="write an INT8 variant next to the model")
+    quant.add_argument("--model", required=True)
+    quant.add_argument("--mode", choices=QUANTIZATION_MODES, default="dynamic")
+    quant.add_argument("--output")
+    quant.add_argument("--calibration-dir")
+
+    select = sub.add_parser("select", help="benchmark variants and report the selection")
+    select.add_argument("--model", required=True)
+    select.add_argument("--holdout-dir", required=True)
+    select.add_argument("--tolerance", type=float, default=0.01)
+    select.add_argument("--repeats", type=int, default=10)
+
+    args = parser.parse_args(argv)
+    if args.command == "quantize":
+        print(quantize_model(args.model, args.mode, args.output, args.calibration_dir))
+        return
+    _, reports = benchmark_variants(
+        args.model, load_keypoint_samples(args.holdout_dir), tolerance=args.tolerance, repeats=args.repeats
+    )
+    print(json.dumps([r.to_dict() for r in reports], indent=2))
+
+
+if __name__ == "__main__":
+    main()
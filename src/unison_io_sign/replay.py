@@ -0,0 +1,354 @@
+"""
+Record and replay sign sessions for offline tuning.
+
+`SessionRecorder` writes per-frame sign likelihoods, keypoint features, timestamps and
+optional ground-truth labels to a compact binary log. `replay_session` drives the
+detector -> interpreter -> provider chain over a log as fast as the CPU allows. Time
+follows the recorded timestamps, and each provider call holds the provider for a
+modelled cost (`compute_ms` per segment plus `compute_ms_per_frame`), so runs and
+sweeps are deterministic. Queued segments wait while the provider is busy, so
+deadline and budget settings behave as they would live. `measure_compute` uses the
+measured call time instead; the real CPU cost is reported as `cpu_ms` either way.
+`sweep` fans many `DetectionConfig` / `InterpreterConfig` / cost combinations out
+across processes.
+
+    python -m unison_io_sign.replay session.usrl --segment-size 4 8 --deadline-ms 300 --compute-ms 40 80
+
+Log format (little endian): the `USRL` magic and a version byte, then one record
+per frame: int64 timestamp_ms, float32 sign_likelihood, uint16 feature count,
+uint16 label byte length, the float32 features and the UTF-8 label.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import struct
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .detector import DetectionConfig, SignPresenceDetector
+from .interpreter import InterpreterConfig, SignInterpreter
+from .keypoints import KeypointResult
+from .provider import SignLanguageProvider
+from .schemas import SignInterpretation, SigningOutput, VideoSegment
+
+MAGIC = b"USRL"
+VERSION = 1
+_HEADER = struct.Struct("<4sB")
+_RECORD = struct.Struct("<qfHH")
+
+
+@dataclass
+class RecordedFrame:
+    timestamp_ms: int
+    sign_likelihood: float
+    features: List[float] = field(default_factory=list)
+    label: Optional[str] = None
+
+
+class SessionRecorder:
+    def __init__(self, path: str):
+        self.path = path
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION))
+
+    def record(self, frame: RecordedFrame) -> None:
+        label = (frame.label or "").encode("utf-8")
+        features = np.asarray(frame.features, dtype="<f4")
+        self._file.write(_RECORD.pack(frame.timestamp_ms, frame.sign_likelihood, features.size, len(label)))
+        self._file.write(features.tobytes())
+        self._file.write(label)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "SessionRecorder":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def read_session(path: str) -> List[RecordedFrame]:
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a session log (magic={magic!r}, version={version})")
+    frames: List[RecordedFrame] = []
+    offset = _HEADER.size
+    while offset < len(data):
+        timestamp_ms, likelihood, count, label_len = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        features = np.frombuffer(data, dtype="<f4", count=count, offset=offset).tolist()
+        offset += 4 * count
+        label = data[offset : offset + label_len].decode("utf-8") or None
+        offset += label_len
+        frames.append(RecordedFrame(timestamp_ms, likelihood, features, label))
+    return frames
+
+
+class RecordedKeypointExtractor:
+    """Serves recorded features instead of running a keypoint backend."""
+
+    def extract(self, frames: List[Any]) -> KeypointResult:
+        return KeypointResult(
+            hand_landmarks=[],
+            body_landmarks=[],
+            frame_features=[list(getattr(f, "features", [])) for f in frames],
+        )
+
+
+def default_provider_factory() -> SignLanguageProvider:
+    from .providers.asl import ASLProvider
+
+    return ASLProvider(extractor=RecordedKeypointExtractor())
+
+
+@dataclass
+class ReplayConfig:
+    detection: DetectionConfig = field(default_factory=DetectionConfig)
+    interpreter: InterpreterConfig = field(default_factory=InterpreterConfig)
+    compute_ms: float = 0.0  # modelled provider time per segment
+    compute_ms_per_frame: float = 0.0  # plus this much per frame in the segment
+    measure_compute: bool = False  # use measured provider time instead (not deterministic)
+    name: str = ""
+
+    def label(self) -> str:
+        cost = "measured" if self.measure_compute else f"{self.compute_ms}+{self.compute_ms_per_frame}/frame"
+        return self.name or (
+            f"detect={self.detection.detect_threshold} lose={self.detection.lose_threshold} "
+            f"sustain={self.detection.sustain_frames} segment={self.interpreter.segment_size} "
+            f"deadline={self.interpreter.deadline_ms} compute={cost}"
+        )
+
+    def segment_cost_ms(self, frame_count: int) -> float:
+        return self.compute_ms + self.compute_ms_per_frame * frame_count
+
+
+@dataclass
+class ReplayReport:
+    name: str
+    frames: int = 0
+    events: int = 0
+    segments: int = 0
+    labelled_segments: int = 0
+    correct_segments: int = 0
+    deadline_misses: int = 0
+    shed_segments: int = 0
+    latency_ms: List[float] = field(default_factory=list)  # first frame -> result, per segment
+    cpu_ms: float = 0.0
+    wall_ms: float = 0.0
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct_segments / self.labelled_segments if self.labelled_segments else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        latencies = data.pop("latency_ms") or [0.0]
+        data.update(
+            accuracy=self.accuracy,
+            latency_ms_mean=float(np.mean(latencies)),
+            latency_ms_p95=float(np.percentile(latencies, 95)),
+            cpu_ms_per_frame=self.cpu_ms / self.frames if self.frames else 0.0,
+            frames_per_second=1000.0 * self.frames / self.wall_ms if self.wall_ms else 0.0,
+        )
+        return data
+
+
+class _ReplayClock:
+    """Recorded-timeline clock in ms; `busy_until` is when the provider is next free."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.busy_until = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _ReplayProvider:
+    """Scores each segment and advances the replay clock by its compute time."""
+
+    def __init__(
+        self,
+        inner: SignLanguageProvider,
+        report: ReplayReport,
+        clock: _ReplayClock,
+        config: ReplayConfig,
+        timer: Callable[[], float],
+    ):
+        self.inner = inner
+        self.report = report
+        self.clock = clock
+        self.config = config
+        self.timer = timer
+
+    @property
+    def language_code(self) -> str:
+        return self.inner.language_code
+
+    def interpret_segment(self, segment: VideoSegment) -> SignInterpretation:
+        frames = segment.frames or []
+        start = self.timer()
+        interp = self.inner.interpret_segment(segment)
+        if self.config.measure_compute:
+            self.clock.now += (self.timer() - start) * 1000.0
+        else:
+            self.clock.now += self.config.segment_cost_ms(len(frames))
+        self.clock.busy_until = self.clock.now
+        self.report.segments += 1
+        if frames:
+            self.report.latency_ms.append(self.clock.now - frames[0].timestamp_ms)
+        labels = Counter(f.label for f in frames if getattr(f, "label", None))
+        if labels:
+            self.report.labelled_segments += 1
+            if interp.text == labels.most_common(1)[0][0]:
+                self.report.correct_segments += 1
+        return interp
+
+    def reset_stream(self) -> None:
+        reset = getattr(self.inner, "reset_stream", None)
+        if reset is not None:
+            reset()
+
+    def generate_output(self, text: str) -> SigningOutput:
+        return self.inner.generate_output(text)
+
+
+def replay_session(
+    frames: Sequence[RecordedFrame],
+    config: Optional[ReplayConfig] = None,
+    provider_factory: Callable[[], SignLanguageProvider] = default_provider_factory,
+    timer: Callable[[], float] = time.perf_counter,
+) -> ReplayReport:
+    """
+    Replay `frames` through the detector -> interpreter -> provider chain. Frames reach
+    the interpreter only while sign presence is active; losing presence closes the
+    current stream. The provider takes the oldest queued segment whenever it is free
+    and holds it for the config's modelled cost, or for the time `timer` (seconds)
+    measures when `measure_compute` is set.
+    """
+    config = config or ReplayConfig()
+    report = ReplayReport(name=config.label(), frames=len(frames))
+    detector = SignPresenceDetector(config.detection)
+    clock = _ReplayClock()
+    provider = _ReplayProvider(provider_factory(), report, clock, config, timer)
+    interpreter = SignInterpreter(provider, config.interpreter, clock)
+
+    def serve_until(limit_ms: float) -> None:
+        while interpreter.pending_segments and clock.busy_until < limit_ms:
+            clock.now = max(clock.now, clock.busy_until)
+            interpreter.interpret_pending(max_segments=1)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    active = False
+    for frame in frames:
+        serve_until(frame.timestamp_ms)
+        clock.now = float(frame.timestamp_ms)
+        for event in detector.process_frames([frame]):
+            report.events += 1
+            if event.event_type == "sign_presence_detected":
+                active = True
+            elif event.event_type == "sign_presence_lost":
+                active = False
+                interpreter.close_stream()
+        if active:
+            interpreter.enqueue_frames([frame])
+    interpreter.close_segment()
+    serve_until(float("inf"))
+    report.deadline_misses = interpreter.stats.deadline_misses
+    report.shed_segments = interpreter.stats.shed_segments
+    report.cpu_ms = (time.process_time() - cpu_start) * 1000.0
+    report.wall_ms = (time.perf_counter() - wall_start) * 1000.0
+    return report
+
+
+def config_grid(
+    detection: Optional[Dict[str, Iterable[Any]]] = None,
+    interpreter: Optional[Dict[str, Iterable[Any]]] = None,
+    replay: Optional[Dict[str, Iterable[Any]]] = None,
+) -> List[ReplayConfig]:
+    """
+    Cartesian product of `DetectionConfig` / `InterpreterConfig` field values and
+    `ReplayConfig` cost fields (`compute_ms`, `compute_ms_per_frame`, ...).
+    """
+    detection = {k: list(v) for k, v in (detection or {}).items()}
+    interpreter = {k: list(v) for k, v in (interpreter or {}).items()}
+    replay = {k: list(v) for k, v in (replay or {}).items()}
+    configs: List[ReplayConfig] = []
+    for det_values in itertools.product(*detection.values()):
+        det = replace(DetectionConfig(), **dict(zip(detection, det_values)))
+        for int_values in itertools.product(*interpreter.values()):
+            interp = replace(InterpreterConfig(), **dict(zip(interpreter, int_values)))
+            for replay_values in itertools.product(*replay.values()):
+                configs.append(ReplayConfig(detection=det, interpreter=interp, **dict(zip(replay, replay_values))))
+    return configs
+
+
+def _replay_log(path: str, config: ReplayConfig, provider_factory: Callable[[], SignLanguageProvider]) -> ReplayReport:
+    return replay_session(read_session(path), config, provider_factory)
+
+
+def sweep(
+    path: str,
+    configs: Sequence[ReplayConfig],
+    provider_factory: Callable[[], SignLanguageProvider] = default_provider_factory,
+    max_workers: Optional[int] = None,
+) -> List[ReplayReport]:
+    """
+    Replay the log at `path` once per config, in parallel processes. `provider_factory`
+    must be picklable (a module-level function). `max_workers=1` runs inline. Configs
+    with `measure_compute` are timed under CPU contention from the other workers;
+    prefer a modelled cost for sweeps.
+    """
+    if max_workers == 1:
+        frames = read_session(path)
+        return [replay_session(frames, config, provider_factory) for config in configs]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_replay_log, path, config, provider_factory) for config in configs]
+        return [future.result() for future in futures]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m unison_io_sign.replay")
+    parser.add_argument("log")
+    parser.add_argument("--detect-threshold", type=float, nargs="+", default=[DetectionConfig.detect_threshold])
+    parser.add_argument("--lose-threshold", type=float, nargs="+", default=[DetectionConfig.lose_threshold])
+    parser.add_argument("--sustain-frames", type=int, nargs="+", default=[DetectionConfig.sustain_frames])
+    parser.add_argument("--segment-size", type=int, nargs="+", default=[InterpreterConfig.segment_size])
+    parser.add_argument("--deadline-ms", type=float, nargs="+", default=[InterpreterConfig.deadline_ms])
+    parser.add_argument("--compute-ms", type=float, nargs="+", default=[ReplayConfig.compute_ms])
+    parser.add_argument("--compute-ms-per-frame", type=float, nargs="+", default=[ReplayConfig.compute_ms_per_frame])
+    parser.add_argument("--measure-compute", action="store_true", help="use measured provider time (not deterministic)")
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args(argv)
+
+    configs = config_grid(
+        detection={
+            "detect_threshold": args.detect_threshold,
+            "lose_threshold": args.lose_threshold,
+            "sustain_frames": args.sustain_frames,
+        },
+        interpreter={"segment_size": args.segment_size, "deadline_ms": args.deadline_ms},
+        replay={
+            "compute_ms": args.compute_ms,
+            "compute_ms_per_frame": args.compute_ms_per_frame,
+            "measure_compute": [args.measure_compute],
+        },
+    )
+    reports = sweep(args.log, configs, max_workers=args.workers)
+    print(json.dumps([r.to_dict() for r in reports], indent=2))
+
+
+if __name__ == "__main__":
+    main()
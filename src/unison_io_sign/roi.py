@@ -0,0 +1,215 @@
+"""
+Region-of-interest hand tracking.
+
+Hands move only a little between consecutive frames, so hand detection can run on a
+crop around the previous hand boxes and the pose wrists instead of the full frame.
+Crops are downscaled by pixel striding (no OpenCV dependency) and landmarks are
+mapped back to full-frame normalized coordinates. When the crop result is not
+confident enough, the tracker falls back to a full-frame search.
+
+The tracker is not used by `MediaPipeExtractor`. In `benchmarks/bench_roi.py` it
+was no faster than full-frame video-mode Hands (synthetic clip, 720p: 26.5 vs 26.9
+fps, 1080p: 24.5 vs 25.9 fps), since MediaPipe already resizes to fixed model inputs
+and skips palm detection while tracking.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Box = Tuple[float, float, float, float]  # normalized (x0, y0, x1, y1)
+
+# MediaPipe Pose landmark indices
+LEFT_WRIST = 15
+RIGHT_WRIST = 16
+
+
+@dataclass
+class ROIConfig:
+    padding: float = 1.0  # expand previous hand boxes by this fraction of their size (palm detection needs context)
+    wrist_box_size: float = 0.3  # normalized side of the box seeded around a pose wrist
+    max_side: int = 256  # longer side of the crop passed to hand detection
+    min_tracking_confidence: float = 0.6
+    max_area: float = 0.6  # regions larger than this fraction of the frame run full-frame
+
+
+@dataclass
+class ROIStats:
+    frames: int = 0
+    roi_runs: int = 0
+    full_frame_runs: int = 0
+    fallbacks: int = 0  # ROI attempts that were retried full-frame
+    recenters: int = 0  # times the tracked region moved
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def landmarks_box(landmark_list: Any) -> Optional[Box]:
+    points = getattr(landmark_list, "landmark", landmark_list) or []
+    xs = [float(pt.x) for pt in points]
+    ys = [float(pt.y) for pt in points]
+    if not xs:
+        return None
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def expand_box(box: Box, padding: float) -> Box:
+    x0, y0, x1, y1 = box
+    pad_x = (x1 - x0) * padding
+    pad_y = (y1 - y0) * padding
+    return (
+        max(0.0, x0 - pad_x),
+        max(0.0, y0 - pad_y),
+        min(1.0, x1 + pad_x),
+        min(1.0, y1 + pad_y),
+    )
+
+
+def contains_box(outer: Box, inner: Box) -> bool:
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and outer[2] >= inner[2] and outer[3] >= inner[3]
+
+
+def union_boxes(boxes: Sequence[Box]) -> Optional[Box]:
+    if not boxes:
+        return None
+    return (
+        min(b[0] for b in boxes),
+        min(b[1] for b in boxes),
+        max(b[2] for b in boxes),
+        max(b[3] for b in boxes),
+    )
+
+
+def wrist_boxes(pose_landmarks: Any, size: float, min_visibility: float = 0.5) -> List[Box]:
+    points = getattr(pose_landmarks, "landmark", None)
+    if not points or len(points) <= RIGHT_WRIST:
+        return []
+    half = size / 2.0
+    boxes: List[Box] = []
+    for idx in (LEFT_WRIST, RIGHT_WRIST):
+        pt = points[idx]
+        if getattr(pt, "visibility", 1.0) < min_visibility:
+            continue
+        x, y = float(pt.x), float(pt.y)
+        boxes.append((max(0.0, x - half), max(0.0, y - half), min(1.0, x + half), min(1.0, y + half)))
+    return boxes
+
+
+def crop_frame(frame: np.ndarray, box: Box, max_side: int) -> Tuple[np.ndarray, Tuple[int, int, int, int]]:
+    """
+    Crop `frame` to `box` and stride-downscale so the longer side is at most `max_side`.
+    Returns the crop and the pixel box (x0, y0, x1, y1) it covers in the full frame.
+    """
+    height, width = frame.shape[:2]
+    x0 = int(box[0] * width)
+    y0 = int(box[1] * height)
+    x1 = max(x0 + 1, int(np.ceil(box[2] * width)))
+    y1 = max(y0 + 1, int(np.ceil(box[3] * height)))
+    region = frame[y0:y1, x0:x1]
+    step = max(1, int(np.ceil(max(region.shape[:2]) / max(1, max_side))))
+    if step > 1:
+        region = region[::step, ::step]
+    return np.ascontiguousarray(region), (x0, y0, x1, y1)
+
+
+def remap_landmarks(landmark_list: Any, pixel_box: Tuple[int, int, int, int], width: int, height: int) -> None:
+    """Map crop-normalized landmarks back to full-frame normalized coordinates in place."""
+    x0, y0, x1, y1 = pixel_box
+    scale_x = (x1 - x0) / width
+    scale_y = (y1 - y0) / height
+    for pt in getattr(landmark_list, "landmark", landmark_list):
+        pt.x = x0 / width + float(pt.x) * scale_x
+        pt.y = y0 / height + float(pt.y) * scale_y
+        pt.z = float(pt.z) * scale_x
+
+
+def _hand_scores(result: Any) -> List[float]:
+    scores: List[float] = []
+    for handedness in getattr(result, "multi_handedness", None) or []:
+        classification = getattr(handedness, "classification", None) or []
+        scores.append(float(classification[0].score) if classification else 0.0)
+    return scores
+
+
+class HandROITracker:
+    """
+    Wraps a hand detector `detect(image) -> result` (MediaPipe Hands-style result with
+    `multi_hand_landmarks` / `multi_handedness`) with ROI tracking.
+
+    The region is sticky: it is kept until a hand or wrist leaves it, so a video-mode
+    detector sees a stable crop and can keep tracking instead of re-running palm
+    detection every frame.
+    """
+
+    def __init__(self, config: Optional[ROIConfig] = None):
+        self.config = config or ROIConfig()
+        self.stats = ROIStats()
+        self._prev_boxes: List[Box] = []
+        self._box: Optional[Box] = None
+
+    def reset(self) -> None:
+        self._prev_boxes = []
+        self._box = None
+
+    def region(self, pose_landmarks: Any = None) -> Optional[Box]:
+        wrists = wrist_boxes(pose_landmarks, self.config.wrist_box_size)
+        targets = self._prev_boxes + wrists
+        if self._box is not None and targets and all(contains_box(self._box, t) for t in targets):
+            return self._box
+        boxes = [expand_box(b, self.config.padding) for b in self._prev_boxes] + wrists
+        box = union_boxes(boxes)
+        self._box = None
+        if box is None:
+            return None
+        area = (box[2] - box[0]) * (box[3] - box[1])
+        if area <= 0.0 or area > self.config.max_area:
+            return None
+        self._box = box
+        self.stats.recenters += 1
+        return box
+
+    def _confident(self, result: Any) -> bool:
+        hands = getattr(result, "multi_hand_landmarks", None) or []
+        if not hands or len(hands) < len(self._prev_boxes):
+            return False
+        scores = _hand_scores(result)
+        return bool(scores) and min(scores) >= self.config.min_tracking_confidence
+
+    def _remember(self, result: Any) -> None:
+        hands = getattr(result, "multi_hand_landmarks", None) or []
+        self._prev_boxes = [b for b in (landmarks_box(h) for h in hands) if b is not None]
+
+    def track(
+        self,
+        frame: Any,
+        detect: Callable[[Any], Any],
+        pose_landmarks: Any = None,
+        detect_full: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Run hand detection on the tracked region, falling back to `detect_full`
+        (defaults to `detect`) on the full frame when tracking confidence drops.
+        """
+        self.stats.frames += 1
+        box = self.region(pose_landmarks) if isinstance(frame, np.ndarray) else None
+        if box is not None:
+            crop, pixel_box = crop_frame(frame, box, self.config.max_side)
+            result = detect(crop)
+            if self._confident(result):
+                height, width = frame.shape[:2]
+                for hand in result.multi_hand_landmarks:
+                    remap_landmarks(hand, pixel_box, width, height)
+                self.stats.roi_runs += 1
+                self._remember(result)
+                return result
+            self.stats.fallbacks += 1
+            self._box = None
+
+        result = (detect_full or detect)(frame)
+        self.stats.full_frame_runs += 1
+        self._remember(result)
+        return result
@@ -0,0 +1,155 @@
+"""
+Adaptive frame sampling for keypoint extraction.
+
+Running hands + pose on every frame is wasteful while the signer is holding still.
+The sampler decides per frame whether the keypoint backend must run, using a cheap
+frame-difference signal and the keypoint velocity observed on processed frames, and
+linearly interpolates features for the frames it skipped.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass
+class SamplingConfig:
+    """
+    Accuracy/CPU trade-off knobs.
+
+    `max_stride=1` processes every frame (current behavior); larger strides skip
+    more frames while the scene is still. Lower thresholds favor accuracy, higher
+    thresholds favor CPU.
+    """
+
+    max_stride: int = 4
+    motion_threshold: float = 0.02  # mean abs pixel difference (0..1) treated as motion
+    velocity_threshold: float = 0.01  # mean keypoint displacement per frame treated as fast signing
+    diff_step: int = 8  # pixel subsampling step for the frame-difference signal
+
+
+@dataclass
+class SamplingStats:
+    frames_seen: int = 0
+    frames_processed: int = 0
+    frames_skipped: int = 0
+    frames_interpolated: int = 0
+
+    @property
+    def skip_ratio(self) -> float:
+        if not self.frames_seen:
+            return 0.0
+        return self.frames_skipped / self.frames_seen
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "skip_ratio": self.skip_ratio}
+
+
+class AdaptiveFrameSampler:
+    """
+    Runs `process(frame) -> features` on a subset of frames and fills the rest.
+
+    State (last processed frame, its features and the motion estimate) carries over
+    between calls, so skipping spans segment boundaries. Skipped frames are linearly
+    interpolated between the surrounding processed frames; trailing skipped frames
+    hold the last processed features. Frames that are not numpy arrays carry no
+    motion signal and are always processed. `MediaPipeExtractor.reset()` resets it when
+    a new stream starts.
+    """
+
+    def __init__(self, config: Optional[SamplingConfig] = None):
+        self.config = config or SamplingConfig()
+        self.stats = SamplingStats()
+        self.reset()
+
+    def reset(self) -> None:
+        self._position = 0  # frames seen since reset
+        self._last_position = -1
+        self._last_frame: Any = None
+        self._last_features: Optional[List[float]] = None
+        self._fast = True  # assume motion until two processed frames say otherwise
+
+    def _frame_motion(self, frame: Any, reference: Any) -> Optional[float]:
+        if not isinstance(frame, np.ndarray) or not isinstance(reference, np.ndarray):
+            return None
+        if frame.shape != reference.shape:
+            return None
+        step = max(1, self.config.diff_step)
+        a = frame[::step, ::step].astype(np.float32)
+        b = reference[::step, ::step].astype(np.float32)
+        scale = 255.0 if frame.dtype == np.uint8 else 1.0
+        return float(np.mean(np.abs(a - b))) / scale
+
+    @staticmethod
+    def _velocity(current: List[float], previous: List[float], gap: int) -> Optional[float]:
+        if not current or not previous or len(current) != len(previous) or gap <= 0:
+            return None
+        cur = np.asarray(current, dtype=np.float32)
+        prev = np.asarray(previous, dtype=np.float32)
+        return float(np.mean(np.abs(cur - prev))) / gap
+
+    def sample(self, frames: List[Any], process: Callable[[Any], List[float]]) -> List[List[float]]:
+        """
+        Return one feature vector per input frame, running `process` only where needed.
+        """
+        base = self._position
+        anchor = (self._last_position, self._last_features)
+        features: List[Optional[List[float]]] = [None] * len(frames)
+
+        for idx, frame in enumerate(frames):
+            position = base + idx
+            self.stats.frames_seen += 1
+            run = self._last_features is None
+            if not run:
+                stride = 1 if self._fast else max(1, self.config.max_stride)
+                motion = self._frame_motion(frame, self._last_frame)
+                run = (
+                    motion is None
+                    or motion >= self.config.motion_threshold
+                    or position - self._last_position >= stride
+                )
+            if not run:
+                self.stats.frames_skipped += 1
+                continue
+
+            current = process(frame)
+            features[idx] = current
+            self.stats.frames_processed += 1
+            if self._last_features is not None:
+                gap = position - self._last_position
+                velocity = self._velocity(current, self._last_features, gap)
+                self._fast = velocity is None or velocity >= self.config.velocity_threshold
+            self._last_position = position
+            self._last_frame = frame
+            self._last_features = current
+
+        self._position = base + len(frames)
+        return self._fill(features, base, anchor)
+
+    def _fill(
+        self,
+        features: List[Optional[List[float]]],
+        base: int,
+        anchor: Tuple[int, Optional[List[float]]],
+    ) -> List[List[float]]:
+        filled: List[List[float]] = []
+        prev_position, before = anchor
+        for idx, feat in enumerate(features):
+            position = base + idx
+            if feat is not None:
+                prev_position, before = position, feat
+                filled.append(feat)
+                continue
+            next_idx = next((j for j in range(idx + 1, len(features)) if features[j] is not None), None)
+            after = features[next_idx] if next_idx is not None else None
+            if before and after is not None and len(before) == len(after):
+                t = (position - prev_position) / (base + next_idx - prev_position)  # type: ignore[operator]
+                interp = (1.0 - t) * np.asarray(before, dtype=np.float32) + t * np.asarray(after, dtype=np.float32)
+                filled.append([float(v) for v in interp])
+            else:
+                filled.append(list(before if before is not None else after or []))
+            self.stats.frames_interpolated += 1
+        return filled
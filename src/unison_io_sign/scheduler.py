@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from .interpreter import SignInterpreter
+from .schemas import SignInterpretation, SignPresenceEvent
+
+
+@dataclass
+class SchedulerConfig:
+    max_total_frames: Optional[int] = None  # node-wide frame budget across sessions
+
+
+@dataclass
+class _Session:
+    interpreter: SignInterpreter
+    active: bool = False
+
+
+class SessionScheduler:
+    """
+    Shares provider time between interpreter sessions under overload.
+
+    Sessions with an active signer are served before idle ones, and within each group
+    the segment with the earliest deadline goes first; ties (including sessions
+    without a deadline) go to the segment that has waited longest. When the node-wide frame budget
+    is exceeded, frames are shed from idle sessions before active ones, largest backlog
+    first. Per-session deadlines and budgets come from each `InterpreterConfig`.
+    """
+
+    def __init__(self, config: Optional[SchedulerConfig] = None):
+        self.config = config or SchedulerConfig()
+        self._sessions: Dict[str, _Session] = {}
+
+    def add_session(self, session_id: str, interpreter: SignInterpreter, active: bool = False) -> None:
+        self._sessions[session_id] = _Session(interpreter=interpreter, active=active)
+
+    def remove_session(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    def set_active(self, session_id: str, active: bool) -> None:
+        self._sessions[session_id].active = active
+
+    def on_presence_event(self, session_id: str, event: SignPresenceEvent) -> None:
+        if event.event_type == "sign_presence_detected":
+            self.set_active(session_id, True)
+        elif event.event_type == "sign_presence_lost":
+            self.set_active(session_id, False)
+            self._sessions[session_id].interpreter.close_stream()
+
+    @property
+    def pending_frames(self) -> int:
+        return sum(s.interpreter.pending_frames for s in self._sessions.values())
+
+    def submit(self, session_id: str, frames: Iterable[object]) -> None:
+        self._sessions[session_id].interpreter.enqueue_frames(frames)
+        self._enforce_budget()
+
+    def run(self, max_segments: Optional[int] = None) -> Dict[str, List[SignInterpretation]]:
+        """Interpret queued segments in priority order; returns results per session."""
+        results: Dict[str, List[SignInterpretation]] = {}
+        served = 0
+        while max_segments is None or served < max_segments:
+            ready = [(sid, s) for sid, s in self._sessions.items() if s.interpreter.pending_segments]
+            if not ready:
+                break
+            session_id, session = min(ready, key=self._priority)
+            interps = session.interpreter.interpret_pending(max_segments=1)
+            if interps:
+                results.setdefault(session_id, []).extend(interps)
+                served += len(interps)
+        return results
+
+    def stats(self) -> Dict[str, dict]:
+        per_session = {sid: s.interpreter.stats.to_dict() for sid, s in self._sessions.items()}
+        totals: Dict[str, int] = {}
+        for counters in per_session.values():
+            for name, value in counters.items():
+                totals[name] = totals.get(name, 0) + value
+        return {"sessions": per_session, "totals": totals}
+
+    @staticmethod
+    def _priority(item) -> tuple:
+        _, session = item
+        deadline = session.interpreter.next_deadline_ms()
+        arrived = session.interpreter.oldest_arrival_ms()
+        return (
+            not session.active,
+            deadline if deadline is not None else float("inf"),
+            arrived if arrived is not None else float("inf"),
+        )
+
+    def _enforce_budget(self) -> None:
+        budget = self.config.max_total_frames
+        if budget is None:
+            return
+        while self.pending_frames > budget:
+            candidates = [s for s in self._sessions.values() if s.interpreter.pending_segments]
+            if not candidates:
+                return
+            victim = min(candidates, key=lambda s: (s.active, -s.interpreter.pending_frames))
+            if not victim.interpreter.shed_oldest():
+                return
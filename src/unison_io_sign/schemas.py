@@ -2,33 +2,107 @@
 Shared schemas for sign-language I/O services.
 
 These dataclasses are JSON-friendly and intentionally minimal for Phase 0.
+
+They sit on the per-frame hot path, so they are slotted, segment ids come from a
+process-local counter rather than `uuid4()`, and `to_dict` copies containers instead
+of deep-copying every value.
+
+`segment_id` is a version-4-shaped UUID string: a random per-process prefix (renewed
+in forked children) followed by a counter, so ids parse as UUIDs and stay unique
+across workers but are sequential within a process.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import itertools
+import os
+import sys
 import uuid
 import time
 
 JsonDict = Dict[str, Any]
 
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_ID_PREFIX = ""
+_segment_counter = itertools.count(1)
+
+
+def _reset_segment_ids() -> None:
+    """Draw a fresh id prefix; runs at import and in forked children."""
+    global _ID_PREFIX, _segment_counter
+    # first three UUID groups, with the version nibble set to 4
+    raw = uuid.uuid4().hex
+    _ID_PREFIX = f"{raw[:8]}-{raw[8:12]}-4{raw[13:16]}-"
+    _segment_counter = itertools.count(1)
+
+
+_reset_segment_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_segment_ids)
+
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
-@dataclass
+def next_segment_id() -> str:
+    n = next(_segment_counter)
+    # last two groups hold the counter, with the RFC 4122 variant bits set
+    return f"{_ID_PREFIX}{0x8000 | ((n >> 48) & 0x3FFF):04x}-{n & 0xFFFFFFFFFFFF:012x}"
+
+
+def format_timestamp(epoch_s: Optional[float] = None) -> str:
+    """
+    ISO-8601 UTC timestamp at second resolution. The formatted string is reused until
+    the second changes, so bursts of events format once.
+    """
+    global _timestamp_cache
+    second = int(time.time() if epoch_s is None else epoch_s)
+    cached_second, cached = _timestamp_cache
+    if second != cached_second:
+        cached = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        _timestamp_cache = (second, cached)
+    return cached
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_copy_value(v) for v in value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return _to_dict(value)
+    return value
+
+
+def _to_dict(obj: Any) -> JsonDict:
+    """Equivalent of `dataclasses.asdict` that copies containers but not leaf values."""
+    cls = type(obj)
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(obj))
+    return {name: _copy_value(getattr(obj, name)) for name in names}
+
+
+@dataclass(**_SLOTS)
 class AvatarInstructions:
     version: str = "1.0"
     rig: str = "default_humanoid"
     keyframes: List[JsonDict] = field(default_factory=list)
 
     def to_dict(self) -> JsonDict:
-        return asdict(self)
+        return _to_dict(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SigningOutput:
     language: str
     text: str
@@ -36,13 +110,10 @@ class SigningOutput:
     avatar_instructions: AvatarInstructions = field(default_factory=AvatarInstructions)
 
     def to_dict(self) -> JsonDict:
-        data = asdict(self)
-        # Ensure nested dataclass is flattened correctly
-        data["avatar_instructions"] = self.avatar_instructions.to_dict()
-        return data
+        return _to_dict(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SignPresenceEvent:
     event_type: str  # "sign_presence_detected" | "sign_presence_lost"
     timestamp: str
@@ -52,22 +123,22 @@ class SignPresenceEvent:
     confidence: Optional[float] = None
 
     def to_dict(self) -> JsonDict:
-        return asdict(self)
+        return _to_dict(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VideoSegment:
-    segment_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    segment_id: str = field(default_factory=next_segment_id)
     start_time_ms: int = field(default_factory=_now_ms)
     end_time_ms: Optional[int] = None
     frames: Optional[List[Any]] = None  # placeholder; future: keypoints or frame refs
     metadata: JsonDict = field(default_factory=dict)
 
     def to_dict(self) -> JsonDict:
-        return asdict(self)
+        return _to_dict(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SignInterpretation:
     language: str
     segment_id: str
@@ -81,7 +152,7 @@ class SignInterpretation:
     metadata: JsonDict = field(default_factory=dict)
 
     def to_dict(self) -> JsonDict:
-        return asdict(self)
+        return _to_dict(self)
 
     @classmethod
     def from_stub(
@@ -93,12 +164,19 @@ class SignInterpretation:
         gloss: Optional[List[str]] = None,
         segment: Optional[VideoSegment] = None,
     ) -> "SignInterpretation":
-        seg = segment or VideoSegment()
+        if segment is None:
+            # no placeholder VideoSegment: allocate just the id and one clock read
+            now = _now_ms()
+            segment_id, start_time_ms, end_time_ms = next_segment_id(), now, now
+        else:
+            segment_id = segment.segment_id
+            start_time_ms = segment.start_time_ms
+            end_time_ms = segment.end_time_ms or _now_ms()
         return cls(
             language=language,
-            segment_id=seg.segment_id,
-            start_time_ms=seg.start_time_ms,
-            end_time_ms=seg.end_time_ms or _now_ms(),
+            segment_id=segment_id,
+            start_time_ms=start_time_ms,
+            end_time_ms=end_time_ms,
             confidence=confidence,
             text=text,
             intent=intent,
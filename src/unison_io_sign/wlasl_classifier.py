@@ -4,11 +4,13 @@ WLASL classifier/translator wrapper using ONNX Runtime.
 
 from __future__ import annotations
 
+import hashlib
 import os
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from .cache import PredictionCache
 from .keypoints import KeypointResult
 
 try:
@@ -17,16 +19,92 @@ except Exception:  # pragma: no cover - optional dependency in some environments
     ort = None
 
 
+def keypoints_to_features(keypoints: KeypointResult) -> np.ndarray:
+    """
+    Flatten per-frame (x, y, z) coordinates into a single 2D feature tensor [1, N].
+    If frame_features are present, use them; otherwise flatten landmarks directly.
+    """
+
+    def _flatten_landmarks(landmarks: List[Any]) -> List[float]:
+        flat: List[float] = []
+        for lm in landmarks:
+            if hasattr(lm, "x") and hasattr(lm, "y") and hasattr(lm, "z"):
+                flat.extend([float(lm.x), float(lm.y), float(lm.z)])
+            else:
+                try:
+                    seq = list(lm)
+                    if len(seq) >= 3:
+                        flat.extend([float(seq[0]), float(seq[1]), float(seq[2])])
+                except Exception:
+                    continue
+        return flat
+
+    if keypoints.frame_features:
+        flat = [coord for frame in keypoints.frame_features for coord in frame]
+    else:
+        flat = _flatten_landmarks(keypoints.hand_landmarks) + _flatten_landmarks(keypoints.body_landmarks)
+    if not flat:
+        flat = [0.0]
+    return np.array([flat], dtype=np.float32)
+
+
 class WLASLClassifier:
-    def __init__(self, model_path: str, session: Optional[Any] = None, labels_path: Optional[str] = None):
+    def __init__(
+        self,
+        model_path: str,
+        session: Optional[Any] = None,
+        labels_path: Optional[str] = None,
+        cache: Optional[PredictionCache] = None,
+    ):
         self.model_path = model_path
         self.session = session or self._load_session(model_path)
         self.labels = self._load_labels(labels_path)
+        self.cache = cache
+        # hash up front so the first cached prediction does not read the model file
+        self._model_version: Optional[str] = self._hash_model(model_path) if cache is not None else None
+        self.variant_reports: List[Any] = []
+
+    @classmethod
+    def from_variants(
+        cls,
+        model_path: str,
+        holdout_dir: Optional[str] = None,
+        tolerance: float = 0.01,
+        labels_path: Optional[str] = None,
+        cache: Optional[PredictionCache] = None,
+    ) -> "WLASLClassifier":
+        """
+        Benchmark the FP32 model and its quantized/pruned siblings on the held-out
+        keypoint fixtures and load the fastest one within `tolerance` accuracy.
+        Without a held-out set the FP32 model is loaded as-is.
+        """
+        from .quantization import benchmark_variants, load_keypoint_samples
+
+        holdout = load_keypoint_samples(holdout_dir) if holdout_dir and os.path.isdir(holdout_dir) else []
+        selected, reports = benchmark_variants(model_path, holdout, tolerance=tolerance)
+        classifier = cls(selected, labels_path=labels_path, cache=cache)
+        classifier.variant_reports = reports
+        return classifier
 
     @property
     def loaded(self) -> bool:
         return self.session is not None
 
+    @property
+    def model_version(self) -> str:
+        """Content hash of the model file, so cached results never outlive a model swap."""
+        if self._model_version is None:
+            self._model_version = self._hash_model(self.model_path)
+        return self._model_version
+
+    @staticmethod
+    def _hash_model(path: str) -> str:
+        try:
+            with open(path, "rb") as f:
+                return hashlib.sha1(f.read()).hexdigest()[:12]
+        except OSError:
+            return str(path)
+
     def _load_session(self, path: str):
         if ort is None:
             return None
@@ -51,32 +129,7 @@ class WLASLClassifier:
             return {}
 
     def _keypoints_to_features(self, keypoints: KeypointResult) -> np.ndarray:
-        """
-        Flatten per-frame (x, y, z) coordinates into a single 2D feature tensor [1, N].
-        If frame_features are present, use them; otherwise flatten landmarks directly.
-        """
-
-        def _flatten_landmarks(landmarks: List[Any]) -> List[float]:
-            flat: List[float] = []
-            for lm in landmarks:
-                if hasattr(lm, "x") and hasattr(lm, "y") and hasattr(lm, "z"):
-                    flat.extend([float(lm.x), float(lm.y), float(lm.z)])
-                else:
-                    try:
-                        seq = list(lm)
-                        if len(seq) >= 3:
-                            flat.extend([float(seq[0]), float(seq[1]), float(seq[2])])
-                    except Exception:
-                        continue
-            return flat
-
-        if keypoints.frame_features:
-            flat = [coord for frame in keypoints.frame_features for coord in frame]
-        else:
-            flat = _flatten_landmarks(keypoints.hand_landmarks) + _flatten_landmarks(keypoints.body_landmarks)
-        if not flat:
-            flat = [0.0]
-        return np.array([flat], dtype=np.float32)
+        return keypoints_to_features(keypoints)
 
     def predict(self, keypoints: KeypointResult, hint_text: Optional[str] = None) -> Tuple[str, float, List[str]]:
         """
@@ -89,32 +142,42 @@ class WLASLClassifier:
             return text, confidence, gloss
 
         features = self._keypoints_to_features(keypoints)
+        # hints override the model text, so only hint-free predictions are cached
+        use_cache = self.cache is not None and hint_text is None
+        if use_cache:
+            cached = self.cache.lookup(self.model_version, features)  # type: ignore[union-attr]
+            if cached is not None:
+                return cached
         inputs = {self.session.get_inputs()[0].name: features}  # type: ignore[index]
         try:
             outputs = self.session.run(None, inputs)  # type: ignore[call-arg]
             scores = outputs[0].squeeze()
-            text = hint_text or "asl_wlasl_onnx"
-            gloss: List[str] = [] if hint_text else ["ONNX"]
-            confidence = 0.7
-            try:
-                # If labels exist, compute argmax and map to text/gloss.
-                if isinstance(scores, np.ndarray) and scores.ndim >= 1:
-                    logits = scores
-                    # softmax
-                    exp_logits = np.exp(logits - np.max(logits))
-                    probs = exp_logits / np.sum(exp_logits)
-                    idx = int(np.argmax(probs))
-                    confidence = float(np.max(probs))
-                    if self.labels and idx in self.labels:
-                        text = self.labels[idx].get("text", text)
-                        gloss = self.labels[idx].get("gloss", gloss)
-                else:
-                    confidence = float(scores)
-            except Exception:
-                pass
-            return text, confidence, gloss
         except Exception:
             text = hint_text or "asl_wlasl_stub"
             gloss = [] if hint_text else ["STUB"]
             confidence = 0.7
             return text, confidence, gloss
+
+        text = hint_text or "asl_wlasl_onnx"
+        gloss: List[str] = [] if hint_text else ["ONNX"]
+        confidence = 0.7
+        try:
+            # If labels exist, compute argmax and map to text/gloss.
+            if isinstance(scores, np.ndarray) and scores.ndim >= 1:
+                logits = scores
+                # softmax
+                exp_logits = np.exp(logits - np.max(logits))
+                probs = exp_logits / np.sum(exp_logits)
+                idx = int(np.argmax(probs))
+                confidence = float(np.max(probs))
+                if self.labels and idx in self.labels:
+                    text = self.labels[idx].get("text", text)
+                    gloss = self.labels[idx].get("gloss", gloss)
+            else:
+                confidence = float(scores)
+        except Exception:
+            pass
+        # stored outside the inference guard so a cache failure is never reported as a stub result
+        if use_cache:
+            self.cache.store(self.model_version, features, (text, confidence, gloss))  # type: ignore[union-attr]
+        return text, confidence, gloss
@@ -0,0 +1,109 @@
+from pathlib import Path
+
+import numpy as np
+
+from unison_io_sign.cache import CacheConfig, PredictionCache
+from unison_io_sign.keypoints import KeypointResult
+from unison_io_sign.wlasl_classifier import WLASLClassifier
+
+FIXTURES = Path(__file__).parent / "fixtures" / "asl"
+
+
+def _features(seed=0, noise=0.0):
+    rng = np.random.default_rng(seed)
+    base = rng.random((1, 300), dtype=np.float32)
+    return base + np.float32(noise)
+
+
+def test_cache_hits_near_identical_features():
+    cache = PredictionCache()
+    cache.store("v1", _features(), ("open settings", 0.9, ["OPEN", "SETTINGS"]))
+    jitter = _features() + np.random.default_rng(1).normal(0, 0.001, (1, 300)).astype(np.float32)
+    assert cache.lookup("v1", jitter) == ("open settings", 0.9, ["OPEN", "SETTINGS"])
+    assert cache.lookup("v1", _features(seed=7)) is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_cache_rejects_scaled_or_shifted_features():
+    cache = PredictionCache()
+    cache.store("v1", _features(), ("open settings", 0.9, []))
+    assert cache.lookup("v1", 3 * _features() + np.float32(0.5)) is None
+    assert cache.lookup("v1", _features(noise=0.05)) is None
+    assert cache.stats.hits == 0
+
+
+def test_cache_keys_include_model_version():
+    cache = PredictionCache()
+    cache.store("v1", _features(), ("open settings", 0.9, []))
+    assert cache.lookup("v2", _features()) is None
+
+
+def test_cache_respects_memory_budget():
+    cache = PredictionCache(CacheConfig(max_bytes=3000))
+    for seed in range(5):
+        cache.store("v1", _features(seed), (f"text{seed}", 0.9, []))
+    assert cache.stats.bytes <= 3000
+    assert cache.stats.evictions > 0
+    # most recent entry survives, oldest was evicted
+    assert cache.lookup("v1", _features(4)) is not None
+    assert cache.lookup("v1", _features(0)) is None
+
+
+class CountingSession:
+    def __init__(self, inner):
+        self.inner = inner
+        self.runs = 0
+
+    def get_inputs(self):
+        return self.inner.get_inputs()
+
+    def run(self, output_names, inputs):
+        self.runs += 1
+        return self.inner.run(output_names, inputs)
+
+
+def test_classifier_serves_repeated_segments_from_cache():
+    model_path = str(FIXTURES / "wlasl_stub.onnx")
+    base = WLASLClassifier(model_path, labels_path=str(FIXTURES / "wlasl_labels.json"))
+    session = CountingSession(base.session)
+    classifier = WLASLClassifier(
+        model_path, session=session, labels_path=str(FIXTURES / "wlasl_labels.json"), cache=PredictionCache()
+    )
+    # hashed at construction, not on the first request
+    assert classifier._model_version is not None
+    keypoints = KeypointResult(hand_landmarks=[], body_landmarks=[], frame_features=[[0.1, 0.2, 0.3, 0.4, 0.5, 0.6]])
+    first = classifier.predict(keypoints)
+    second = classifier.predict(keypoints)
+    assert first == second
+    assert second[0] == "open browser"
+    assert session.runs == 1
+    assert classifier.cache.stats.hits == 1
+    # hinted predictions bypass the cache
+    classifier.predict(keypoints, hint_text="hello")
+    assert session.runs == 2
+
+
+def test_cache_is_safe_under_concurrent_use():
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = PredictionCache(CacheConfig(max_bytes=6000))
+
+    def worker(offset):
+        for i in range(300):
+            features = _features(seed=(offset + i) % 40)
+            if cache.lookup("v1", features) is None:
+                cache.store("v1", features, (f"text{i}", 0.9, ["G"]))
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often to expose races
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+    finally:
+        sys.setswitchinterval(interval)
+    assert cache.stats.entries == len(cache._entries)
+    assert cache.stats.bytes <= 6000
+    assert cache.stats.hits + cache.stats.misses == 8 * 300
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from unison_io_sign.interpreter import SignInterpreter, InterpreterConfig
 from unison_io_sign.providers.asl import ASLProvider
+from unison_io_sign.schemas import SignInterpretation
 
 
 @dataclass
@@ -23,3 +24,42 @@ def test_interpreter_batches_frames():
     # Provider stub returns language code and zero confidence
     assert interpretations[0].language == "asl"
     assert flushed[0].language == "asl"
+
+
+class StreamLogProvider:
+    language_code = "asl"
+
+    def __init__(self):
+        self.log = []
+
+    def reset_stream(self):
+        self.log.append("reset")
+
+    def interpret_segment(self, segment):
+        self.log.append(list(segment.frames))
+        return SignInterpretation.from_stub(language="asl", text="", segment=segment)
+
+
+def test_interpreter_resets_provider_at_stream_boundaries():
+    provider = StreamLogProvider()
+    interpreter = SignInterpreter(provider, InterpreterConfig(segment_size=2))
+    interpreter.ingest_frames([1, 2, 3, 4, 5])
+    interpreter.close_stream()
+    interpreter.ingest_frames([6, 7])
+    interpreter.flush()
+    assert provider.log == ["reset", [1, 2], [3, 4], [5], "reset", [6, 7]]
+
+
+def test_asl_provider_reset_stream_resets_extractor():
+    class ResettableExtractor:
+        resets = 0
+
+        def extract(self, frames):
+            raise AssertionError("not called")
+
+        def reset(self):
+            self.resets += 1
+
+    extractor = ResettableExtractor()
+    ASLProvider(extractor=extractor).reset_stream()
+    assert extractor.resets == 1
@@ -38,3 +38,41 @@ def test_asl_provider_model_path_with_file_uses_model(tmp_path, monkeypatch):
     interp = provider.interpret_segment(segment)
     # With model loaded, confidence is elevated
     assert interp.confidence >= 0.6
+
+
+def test_asl_provider_ignores_malformed_env_settings(monkeypatch, caplog):
+    monkeypatch.setenv("UNISON_SIGN_SAMPLING_MAX_STRIDE", "four")
+    provider = ASLProvider()
+    assert provider.sampling is None
+    assert "UNISON_SIGN_SAMPLING_MAX_STRIDE" in caplog.text
+
+
+def test_asl_provider_reads_per_language_sampling_stride(monkeypatch):
+    monkeypatch.setenv("UNISON_SIGN_SAMPLING_MAX_STRIDE_ASL", "4")
+    provider = ASLProvider()
+    assert provider.sampling.max_stride == 4
+
+
+def test_cache_from_env_ignores_malformed_budget(monkeypatch, caplog):
+    from unison_io_sign.providers.asl import cache_from_env
+
+    monkeypatch.setenv("UNISON_SIGN_RESULT_CACHE_MB", "8MB")
+    assert cache_from_env("asl") is None
+    assert "UNISON_SIGN_RESULT_CACHE_MB" in caplog.text
+    monkeypatch.setenv("UNISON_SIGN_RESULT_CACHE_MB_ASL", "0.5")
+    assert cache_from_env("asl").config.max_bytes == 512 * 1024
+
+
+def test_make_classifier_ignores_malformed_autoselect_settings(monkeypatch, caplog):
+    from pathlib import Path
+
+    from unison_io_sign.providers.asl import make_classifier
+
+    model_path = str(Path(__file__).parent / "fixtures" / "asl" / "wlasl_stub.onnx")
+    monkeypatch.setenv("UNISON_SIGN_MODEL_AUTOSELECT", "sometimes")
+    assert make_classifier(model_path, "asl").model_path == model_path
+    monkeypatch.setenv("UNISON_SIGN_MODEL_AUTOSELECT", "on")
+    monkeypatch.setenv("UNISON_SIGN_MODEL_TOLERANCE", "tight")
+    assert make_classifier(model_path, "asl").model_path == model_path
+    assert "UNISON_SIGN_MODEL_AUTOSELECT" in caplog.text
+    assert "UNISON_SIGN_MODEL_TOLERANCE" in caplog.text
@@ -0,0 +1,148 @@
+from dataclasses import dataclass, field
+import threading
+from typing import List
+
+from unison_io_sign.keypoints import KeypointResult
+from unison_io_sign.providers.router import ClassifierPool, LanguageRouter, RouterConfig
+from unison_io_sign.schemas import VideoSegment
+
+
+@dataclass
+class FakeExtractor:
+    calls: int = 0
+    resets: int = 0
+    frames: List[str] = field(default_factory=list)
+
+    def extract(self, frames):
+        self.calls += 1
+        self.frames.extend(frames)
+        return KeypointResult(hand_landmarks=[], body_landmarks=[], frame_features=[[0.1, 0.2, 0.3]])
+
+    def reset(self):
+        self.resets += 1
+
+
+@dataclass
+class FakeClassifier:
+    text: str
+    confidence: float
+    loaded: bool = True
+    calls: int = 0
+    threads: List[str] = field(default_factory=list)
+
+    def predict(self, keypoints, hint_text=None):
+        self.calls += 1
+        self.threads.append(threading.current_thread().name)
+        return self.text, self.confidence, [self.text.upper()]
+
+
+def _pool(asl=0.9, bsl=0.6):
+    classifiers = {"asl": FakeClassifier("hello", asl), "bsl": FakeClassifier("hiya", bsl)}
+    return ClassifierPool(classifiers, extractor_factory=FakeExtractor, languages=["asl", "bsl"])
+
+
+def _router(asl=0.9, bsl=0.6, **config):
+    pool = _pool(asl, bsl)
+    router = pool.router(RouterConfig(**config))
+    return router, pool.classifiers, router.extractor
+
+
+def test_router_fans_out_once_per_segment_and_keeps_best():
+    router, classifiers, extractor = _router()
+    interp = router.interpret_segment(VideoSegment(frames=["frame"]))
+    assert extractor.calls == 1
+    assert classifiers["asl"].calls == 1
+    assert classifiers["bsl"].calls == 1
+    assert classifiers["asl"].threads[0].startswith("sign-router")
+    assert interp.language == "asl"
+    assert interp.text == "hello"
+    assert interp.metadata["router"]["scores"] == {"asl": 0.9, "bsl": 0.6}
+    router.pool.close()
+
+
+def test_router_pins_after_consistent_confident_wins():
+    router, classifiers, _ = _router(pin_confidence=0.8, pin_segments=2)
+    assert router.language_code == "auto"
+    router.interpret_segment(VideoSegment())
+    assert router.pinned_language is None
+    router.interpret_segment(VideoSegment())
+    assert router.pinned_language == "asl"
+    assert router.language_code == "asl"
+
+    interp = router.interpret_segment(VideoSegment())
+    assert classifiers["bsl"].calls == 2
+    assert classifiers["asl"].calls == 3
+    assert interp.metadata["router"]["pinned"] is True
+    assert router.generate_output("hi").language == "asl"
+
+    router.reset()
+    assert router.pinned_language is None
+    assert router.extractor.resets == 1
+    router.pool.close()
+
+
+def test_sessions_share_models_but_pin_independently():
+    with _pool() as pool:
+        first = pool.router(RouterConfig(pin_segments=1))
+        second = pool.router(RouterConfig(pin_segments=1))
+        first.interpret_segment(VideoSegment())
+        assert first.pinned_language == "asl"
+        assert second.pinned_language is None
+        second.interpret_segment(VideoSegment())
+        assert pool.classifiers["bsl"].calls == 2
+    assert pool._executor is None
+
+
+def test_interleaved_sessions_keep_separate_extractor_state():
+    with _pool() as pool:
+        first, second = pool.router(), pool.router()
+        assert first.extractor is not second.extractor
+        first.interpret_segment(VideoSegment(frames=["a1"]))
+        second.interpret_segment(VideoSegment(frames=["b1"]))
+        first.interpret_segment(VideoSegment(frames=["a2"]))
+        second.interpret_segment(VideoSegment(frames=["b2"]))
+        assert first.extractor.frames == ["a1", "a2"]
+        assert second.extractor.frames == ["b1", "b2"]
+
+
+def test_router_does_not_pin_on_low_confidence():
+    router, _, _ = _router(asl=0.5, bsl=0.4, pin_segments=1)
+    router.interpret_segment(VideoSegment())
+    assert router.pinned_language is None
+
+
+def test_router_without_loaded_models_falls_back_to_stub():
+    pool = ClassifierPool(
+        {"asl": FakeClassifier("x", 0.9, loaded=False)}, extractor_factory=FakeExtractor, languages=["asl", "bsl"]
+    )
+    router = LanguageRouter(pool)
+    interp = router.interpret_segment(VideoSegment(metadata={"text_hint": "open settings"}))
+    assert interp.language == "asl"
+    assert interp.text == "open settings"
+    assert interp.confidence == 0.75
+
+
+def test_router_from_env_builds_per_language_classifiers(monkeypatch):
+    from pathlib import Path
+
+    fixtures = Path(__file__).parent / "fixtures" / "asl"
+    monkeypatch.setenv("UNISON_SIGN_LANGUAGES", "asl, bsl")
+    monkeypatch.setenv("UNISON_SIGN_MODEL_PATH_ASL", str(fixtures / "wlasl_stub.onnx"))
+    monkeypatch.setenv("UNISON_SIGN_LABELS_PATH_ASL", str(fixtures / "wlasl_labels.json"))
+    pool = ClassifierPool.from_env(extractor_factory=FakeExtractor)
+    assert pool.languages == ["asl", "bsl"]
+    assert set(pool.classifiers) == {"asl"}
+    interp = pool.router().interpret_segment(VideoSegment(frames=["frame"]))
+    assert interp.language == "asl"
+    assert interp.text == "open browser"
+
+
+def test_router_from_env_generic_model_path_only_loads_first_language(monkeypatch):
+    from pathlib import Path
+
+    fixtures = Path(__file__).parent / "fixtures" / "asl"
+    monkeypatch.setenv("UNISON_SIGN_LANGUAGES", "bsl,asl")
+    monkeypatch.setenv("UNISON_SIGN_MODEL_PATH", str(fixtures / "wlasl_stub.onnx"))
+    monkeypatch.setenv("UNISON_SIGN_LABELS_PATH", str(fixtures / "wlasl_labels.json"))
+    pool = ClassifierPool.from_env(extractor_factory=FakeExtractor)
+    assert set(pool.classifiers) == {"bsl"}
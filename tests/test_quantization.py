@@ -0,0 +1,72 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from unison_io_sign.quantization import (
+    benchmark_variants,
+    discover_variants,
+    load_keypoint_samples,
+    quantize_model,
+    variant_path,
+)
+from unison_io_sign.wlasl_classifier import WLASLClassifier
+
+pytest.importorskip("onnxruntime.quantization")
+
+FIXTURES = Path(__file__).parent / "fixtures" / "asl"
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    path = tmp_path / "wlasl.onnx"
+    shutil.copy(FIXTURES / "wlasl_stub.onnx", path)
+    return str(path)
+
+
+def test_load_keypoint_samples_from_fixtures():
+    samples = load_keypoint_samples(str(FIXTURES))
+    assert len(samples) == 1
+    assert samples[0].features.shape == (1, 12)
+    assert samples[0].label is None
+
+
+def test_quantize_writes_variants_that_are_discovered(model_path):
+    dynamic = quantize_model(model_path, "dynamic")
+    static = quantize_model(model_path, "static", calibration_dir=str(FIXTURES))
+    assert dynamic == variant_path(model_path, "int8-dynamic")
+    assert Path(static).exists()
+    assert discover_variants(model_path) == {"fp32": model_path, "int8-dynamic": dynamic, "int8-static": static}
+
+
+def test_static_quantization_requires_calibration(model_path):
+    with pytest.raises(ValueError):
+        quantize_model(model_path, "static")
+
+
+def test_benchmark_selects_fastest_variant_within_tolerance(model_path):
+    quantize_model(model_path, "dynamic")
+    holdout = load_keypoint_samples(str(FIXTURES))
+    selected, reports = benchmark_variants(model_path, holdout, tolerance=0.0, repeats=2)
+    assert {r.name for r in reports} == {"fp32", "int8-dynamic"}
+    assert all(r.accuracy == 1.0 for r in reports)
+    chosen = [r for r in reports if r.selected]
+    assert len(chosen) == 1 and chosen[0].path == selected
+    assert chosen[0].latency_ms == min(r.latency_ms for r in reports)
+
+
+def test_classifier_from_variants_loads_selected_model(model_path):
+    quantize_model(model_path, "dynamic")
+    classifier = WLASLClassifier.from_variants(
+        model_path, holdout_dir=str(FIXTURES), labels_path=str(FIXTURES / "wlasl_labels.json")
+    )
+    assert classifier.loaded
+    assert classifier.model_path in discover_variants(model_path).values()
+    assert len(classifier.variant_reports) == 2
+
+
+def test_classifier_from_variants_without_holdout_keeps_fp32(model_path):
+    quantize_model(model_path, "dynamic")
+    classifier = WLASLClassifier.from_variants(model_path)
+    assert classifier.model_path == model_path
+    assert classifier.variant_reports == []
@@ -0,0 +1,147 @@
+import pytest
+
+from unison_io_sign.detector import DetectionConfig
+from unison_io_sign.replay import (
+    RecordedFrame,
+    ReplayConfig,
+    SessionRecorder,
+    config_grid,
+    read_session,
+    replay_session,
+    sweep,
+)
+from unison_io_sign.interpreter import InterpreterConfig
+from unison_io_sign.schemas import AvatarInstructions, SignInterpretation, SigningOutput
+
+
+class LabelEchoProvider:
+    """Returns the label of the segment's last frame, or nothing for idle frames."""
+
+    language_code = "asl"
+
+    def __init__(self, timer=None, compute_s=0.0):
+        self.timer = timer
+        self.compute_s = compute_s
+
+    def interpret_segment(self, segment):
+        if self.timer is not None:
+            self.timer.now += self.compute_s
+        frames = segment.frames or []
+        text = frames[-1].label if frames else None
+        return SignInterpretation.from_stub(language="asl", text=text or "", segment=segment)
+
+    def generate_output(self, text, gloss=None):
+        return SigningOutput(language="asl", text=text, gloss=gloss or [], avatar_instructions=AvatarInstructions())
+
+
+class StepTimer:
+    now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def label_echo_factory():
+    return LabelEchoProvider()
+
+
+def _session():
+    frames = []
+    for i in range(12):
+        signing = 2 <= i < 10
+        frames.append(
+            RecordedFrame(
+                timestamp_ms=i * 33,
+                sign_likelihood=0.875 if signing else 0.125,
+                features=[0.5, 0.25, float(i)],
+                label="open settings" if signing else None,
+            )
+        )
+    return frames
+
+
+def test_recorder_round_trips_frames(tmp_path):
+    path = str(tmp_path / "session.usrl")
+    with SessionRecorder(path) as recorder:
+        for frame in _session():
+            recorder.record(frame)
+    assert read_session(path) == _session()
+
+
+DETECTION = DetectionConfig(detect_threshold=0.5, lose_threshold=0.4, sustain_frames=2)
+
+
+def test_replay_reports_accuracy_and_latency():
+    config = ReplayConfig(detection=DETECTION, compute_ms=10)
+    report = replay_session(_session(), config, provider_factory=label_echo_factory)
+    data = report.to_dict()
+    assert data["frames"] == 12
+    assert data["events"] == 2
+    # frames 2-9 fill one segment; frame 10 is closed into a short idle one on loss
+    assert data["segments"] == 2
+    assert data["labelled_segments"] == 1
+    assert data["accuracy"] == 1.0
+    assert data["deadline_misses"] == 0
+    # first frame -> result: [2..9] waits for frame 9 (297 ms) plus 10 ms compute;
+    # [10] arrives at 330 ms and is closed and served at the loss (363 ms)
+    assert report.latency_ms == pytest.approx([307.0 - 66, 373.0 - 330])
+    assert data["cpu_ms"] >= 0
+
+
+def test_replay_provider_compute_advances_the_clock():
+    config = ReplayConfig(
+        detection=DETECTION, interpreter=InterpreterConfig(segment_size=2, deadline_ms=120), compute_ms=100
+    )
+    report = replay_session(_session(), config, provider_factory=label_echo_factory)
+    # segments [2,3] [4,5] [6,7] [8,9] [10]; 100 ms per call against 66 ms of new frames
+    # per segment builds a backlog: every served result lands over 120 ms, [8,9] is
+    # already stale when the provider frees up and is dropped, and the newest still runs
+    assert report.segments == 4
+    assert report.shed_segments == 1
+    assert report.deadline_misses == 5
+    assert report.latency_ms == pytest.approx([133.0, 167.0, 201.0, 169.0])
+    assert report.accuracy == 1.0
+
+
+def test_replay_can_use_measured_compute_time():
+    timer = StepTimer()
+    interpreter = InterpreterConfig(segment_size=2, deadline_ms=120)
+    measured = ReplayConfig(detection=DETECTION, interpreter=interpreter, compute_ms=5, measure_compute=True)
+    report = replay_session(_session(), measured, lambda: LabelEchoProvider(timer, 0.100), timer=timer)
+    modelled = replay_session(_session(), ReplayConfig(detection=DETECTION, interpreter=interpreter, compute_ms=100))
+    assert report.latency_ms == pytest.approx(modelled.latency_ms)
+    assert report.deadline_misses == modelled.deadline_misses
+
+
+def test_config_grid_builds_cartesian_product():
+    configs = config_grid(
+        detection={"detect_threshold": [0.5, 0.6]},
+        interpreter={"segment_size": [2, 4, 8]},
+        replay={"compute_ms": [0.0, 50.0]},
+    )
+    assert len(configs) == 12
+    assert {c.interpreter.segment_size for c in configs} == {2, 4, 8}
+    assert {c.compute_ms for c in configs} == {0.0, 50.0}
+
+
+def test_sweep_runs_configs_in_parallel(tmp_path):
+    path = str(tmp_path / "session.usrl")
+    with SessionRecorder(path) as recorder:
+        for frame in _session():
+            recorder.record(frame)
+    configs = config_grid(
+        detection={"detect_threshold": [0.5], "lose_threshold": [0.4], "sustain_frames": [2]},
+        interpreter={"segment_size": [2, 4], "deadline_ms": [120.0]},
+        replay={"compute_ms": [0.0, 100.0]},
+    )
+    parallel = sweep(path, configs, provider_factory=label_echo_factory, max_workers=2)
+    inline = sweep(path, configs, provider_factory=label_echo_factory, max_workers=1)
+    # modelled cost: identical results regardless of CPU contention between workers
+    for a, b in zip(parallel, inline):
+        assert (a.segments, a.accuracy, a.deadline_misses, a.latency_ms) == (
+            b.segments,
+            b.accuracy,
+            b.deadline_misses,
+            b.latency_ms,
+        )
+    assert [r.deadline_misses for r in inline] == [0, 5, 0, 3]
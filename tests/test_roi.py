@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from unison_io_sign.roi import HandROITracker, ROIConfig, crop_frame, remap_landmarks
+
+
+def _point(x, y, z=0.0, visibility=1.0):
+    return SimpleNamespace(x=x, y=y, z=z, visibility=visibility)
+
+
+def _hand(points):
+    return SimpleNamespace(landmark=[_point(x, y) for x, y in points])
+
+
+def _result(hands, score=0.9):
+    handedness = [SimpleNamespace(classification=[SimpleNamespace(score=score)]) for _ in hands]
+    return SimpleNamespace(multi_hand_landmarks=hands, multi_handedness=handedness)
+
+
+def _pose(left, right):
+    points = [_point(0.5, 0.5) for _ in range(33)]
+    points[15] = _point(*left)
+    points[16] = _point(*right)
+    return SimpleNamespace(landmark=points)
+
+
+def test_crop_frame_downscales_and_reports_pixel_box():
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    crop, pixel_box = crop_frame(frame, (0.25, 0.25, 0.75, 0.75), max_side=80)
+    assert pixel_box == (160, 120, 480, 360)
+    assert max(crop.shape[:2]) <= 80
+    assert crop.flags["C_CONTIGUOUS"]
+
+
+def test_remap_landmarks_to_full_frame():
+    hand = _hand([(0.0, 0.0), (1.0, 1.0)])
+    remap_landmarks(hand, (160, 120, 480, 360), 640, 480)
+    assert (hand.landmark[0].x, hand.landmark[0].y) == (0.25, 0.25)
+    assert (hand.landmark[1].x, hand.landmark[1].y) == (0.75, 0.75)
+
+
+def test_tracker_starts_full_frame_then_uses_roi():
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    shapes = []
+
+    def detect(image):
+        shapes.append(image.shape)
+        return _result([_hand([(0.4, 0.4), (0.5, 0.5)])])
+
+    tracker = HandROITracker(ROIConfig(max_side=64))
+    tracker.track(frame, detect)
+    result = tracker.track(frame, detect)
+    assert shapes[0] == frame.shape
+    assert max(shapes[1][:2]) <= 64
+    assert tracker.stats.full_frame_runs == 1
+    assert tracker.stats.roi_runs == 1
+    # landmarks were mapped back into the tracked region of the full frame
+    x = result.multi_hand_landmarks[0].landmark[0].x
+    assert 0.3 < x < 0.5
+
+
+def test_tracker_seeds_region_from_pose_wrists():
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    calls = []
+
+    def detect(image):
+        calls.append(image.shape)
+        return _result([_hand([(0.4, 0.4), (0.6, 0.6)]), _hand([(0.1, 0.1), (0.2, 0.2)])])
+
+    tracker = HandROITracker()
+    tracker.track(frame, detect, pose_landmarks=_pose((0.3, 0.6), (0.6, 0.6)))
+    assert calls[0] != frame.shape
+    assert tracker.stats.roi_runs == 1
+
+
+def test_tracker_falls_back_when_confidence_drops():
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    tracker = HandROITracker(ROIConfig(min_tracking_confidence=0.8))
+    tracker.track(frame, lambda image: _result([_hand([(0.4, 0.4), (0.5, 0.5)])]))
+
+    full_calls = []
+
+    def detect_full(image):
+        full_calls.append(image.shape)
+        return _result([_hand([(0.4, 0.4), (0.5, 0.5)])])
+
+    tracker.track(frame, lambda image: _result([_hand([(0.4, 0.4), (0.5, 0.5)])], score=0.3), detect_full=detect_full)
+    assert full_calls == [frame.shape]
+    assert tracker.stats.fallbacks == 1
+    assert tracker.stats.full_frame_runs == 2
+
+
+def test_tracker_keeps_region_while_hands_stay_inside():
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    positions = iter([0.40, 0.41, 0.42, 0.95, 0.50])
+    shapes = []
+
+    def detect(image):
+        shapes.append(image.shape)
+        x = next(positions)
+        return _result([_hand([(x, 0.4), (x + 0.1, 0.5)])])
+
+    tracker = HandROITracker()
+    for _ in range(5):
+        tracker.track(frame, detect)
+    # full frame, then one stable crop while the hand drifts inside it; the fourth
+    # result reaches past the crop edge, so the fifth call recenters
+    assert shapes[1] == shapes[2] == shapes[3]
+    assert tracker.stats.recenters == 2
@@ -0,0 +1,93 @@
+import numpy as np
+
+from unison_io_sign.sampling import AdaptiveFrameSampler, SamplingConfig
+
+
+def _still_frames(count):
+    return [np.zeros((32, 32, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def test_sampler_skips_still_frames_and_interpolates():
+    sampler = AdaptiveFrameSampler(SamplingConfig(max_stride=4))
+    calls = []
+
+    def process(frame):
+        calls.append(frame)
+        return [0.5, 0.5, 0.0]
+
+    features = sampler.sample(_still_frames(10), process)
+    assert len(features) == 10
+    assert all(f == [0.5, 0.5, 0.0] for f in features)
+    assert len(calls) < 10
+    stats = sampler.stats
+    assert stats.frames_seen == 10
+    assert stats.frames_processed == len(calls)
+    assert stats.frames_skipped == 10 - len(calls)
+    assert stats.frames_interpolated == stats.frames_skipped
+    assert stats.skip_ratio > 0
+
+
+def test_sampler_interpolates_linearly_across_calls():
+    sampler = AdaptiveFrameSampler(SamplingConfig(max_stride=4, velocity_threshold=1.0))
+    positions = iter([0.0, 0.0, 0.4])
+
+    def process(frame):
+        return [next(positions)]
+
+    # frames 0 and 1 are processed (motion assumed until velocity is known)
+    assert sampler.sample(_still_frames(2), process) == [[0.0], [0.0]]
+    features = sampler.sample(_still_frames(6), process)
+    # frame 5 is the next anchor; 2-4 interpolate from frame 1, 6-7 hold frame 5
+    assert np.allclose([f[0] for f in features], [0.1, 0.2, 0.3, 0.4, 0.4, 0.4], atol=1e-6)
+
+
+def test_sampler_state_spans_segments():
+    sampler = AdaptiveFrameSampler(SamplingConfig(max_stride=8))
+    calls = []
+
+    def process(frame):
+        calls.append(frame)
+        return [0.5]
+
+    for _ in range(10):
+        sampler.sample(_still_frames(8), process)
+    # frames 0 and 1, then every 8th frame: 9, 17, ..., 73
+    assert len(calls) == 11
+    assert sampler.stats.frames_skipped == 69
+    sampler.reset()
+    sampler.sample(_still_frames(1), process)
+    assert len(calls) == 12
+
+
+def test_sampler_processes_every_frame_during_fast_motion():
+    sampler = AdaptiveFrameSampler(SamplingConfig(max_stride=4, velocity_threshold=0.01))
+    counter = {"n": 0}
+
+    def process(frame):
+        counter["n"] += 1
+        return [counter["n"] * 0.1]
+
+    sampler.sample(_still_frames(8), process)
+    assert counter["n"] == 8
+    assert sampler.stats.frames_skipped == 0
+
+
+def test_sampler_processes_on_frame_difference():
+    sampler = AdaptiveFrameSampler(SamplingConfig(max_stride=100))
+    frames = _still_frames(6)
+    frames[3] = np.full((32, 32, 3), 200, dtype=np.uint8)
+    seen = []
+
+    def process(frame):
+        seen.append(int(frame[0, 0, 0]))
+        return [0.0]
+
+    sampler.sample(frames, process)
+    assert 200 in seen
+
+
+def test_sampler_without_image_frames_processes_everything():
+    sampler = AdaptiveFrameSampler(SamplingConfig(max_stride=4))
+    features = sampler.sample(["a", "b", "c"], lambda frame: [0.0])
+    assert features == [[0.0], [0.0], [0.0]]
+    assert sampler.stats.frames_skipped == 0
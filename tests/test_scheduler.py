@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+
+import pytest
+
+from unison_io_sign.interpreter import InterpreterConfig, SignInterpreter
+from unison_io_sign.scheduler import SchedulerConfig, SessionScheduler
+from unison_io_sign.schemas import AvatarInstructions, SignInterpretation, SigningOutput, SignPresenceEvent
+
+
+@dataclass
+class FakeClock:
+    now: float = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SlowProvider:
+    language_code = "asl"
+
+    def __init__(self, clock, latency_ms=0.0, name="p"):
+        self.clock = clock
+        self.latency_ms = latency_ms
+        self.name = name
+        self.calls = []
+
+    def interpret_segment(self, segment):
+        self.calls.append(segment)
+        self.clock.now += self.latency_ms
+        return SignInterpretation.from_stub(language="asl", text=self.name, segment=segment)
+
+    def generate_output(self, text, gloss=None):
+        return SigningOutput(language="asl", text=text, gloss=gloss or [], avatar_instructions=AvatarInstructions())
+
+
+def test_interpreter_sheds_oldest_frames_over_budget():
+    clock = FakeClock()
+    provider = SlowProvider(clock)
+    interpreter = SignInterpreter(provider, InterpreterConfig(segment_size=2, max_buffered_frames=4), clock=clock)
+    interpreter.enqueue_frames(range(10))
+    assert interpreter.pending_frames <= 4
+    assert interpreter.stats.shed_frames == 6
+    interps = interpreter.interpret_pending()
+    # the freshest frames survive
+    assert [seg.frames for seg in provider.calls] == [[6, 7], [8, 9]]
+    assert len(interps) == 2
+
+
+def test_interpreter_rejects_budget_smaller_than_a_segment():
+    with pytest.raises(ValueError):
+        SignInterpreter(SlowProvider(FakeClock()), InterpreterConfig(segment_size=8, max_buffered_frames=4))
+
+
+def test_interpreter_drops_stale_segments_but_serves_newest():
+    clock = FakeClock()
+    provider = SlowProvider(clock, latency_ms=40)
+    interpreter = SignInterpreter(provider, InterpreterConfig(segment_size=1, deadline_ms=100), clock=clock)
+    interpreter.enqueue_frames(["a", "b", "c", "d", "e"])
+    interps = interpreter.interpret_pending()
+    # a, b and c start in time (c lands late at 120); d is 120 ms old when its turn
+    # comes and is dropped; e is stale too but is the newest, so it still runs
+    assert len(interps) == 4
+    assert [seg.frames for seg in provider.calls] == [["a"], ["b"], ["c"], ["e"]]
+    assert interpreter.stats.deadline_misses == 3
+    assert interpreter.stats.shed_frames == 1
+    assert interpreter.stats.segments_interpreted == 4
+
+
+def test_interpreter_recovers_after_one_slow_call():
+    clock = FakeClock()
+    provider = SlowProvider(clock, latency_ms=500)
+    interpreter = SignInterpreter(provider, InterpreterConfig(segment_size=1, deadline_ms=100), clock=clock)
+    assert len(interpreter.ingest_frames(["slow"])) == 1
+    provider.latency_ms = 5
+    served = sum(len(interpreter.ingest_frames([i])) for i in range(50))
+    assert served == 50
+    assert len(provider.calls) == 51
+    assert interpreter.stats.deadline_misses == 1
+    assert interpreter.stats.shed_frames == 0
+
+
+def test_interpreter_defaults_keep_everything():
+    clock = FakeClock()
+    interpreter = SignInterpreter(SlowProvider(clock, latency_ms=1000), InterpreterConfig(segment_size=2), clock=clock)
+    assert len(interpreter.ingest_frames(range(6))) == 3
+    assert interpreter.stats.to_dict() == {
+        "segments_interpreted": 3,
+        "shed_frames": 0,
+        "shed_segments": 0,
+        "deadline_misses": 0,
+    }
+
+
+def test_scheduler_serves_active_sessions_first():
+    clock = FakeClock()
+    idle = SignInterpreter(SlowProvider(clock, name="idle"), InterpreterConfig(segment_size=1), clock=clock)
+    active = SignInterpreter(SlowProvider(clock, name="active"), InterpreterConfig(segment_size=1), clock=clock)
+    scheduler = SessionScheduler()
+    scheduler.add_session("idle", idle)
+    scheduler.add_session("active", active)
+    scheduler.submit("idle", ["i1"])
+    scheduler.submit("active", ["a1"])
+    scheduler.on_presence_event(
+        "active", SignPresenceEvent(event_type="sign_presence_detected", timestamp="", source="test")
+    )
+    results = scheduler.run(max_segments=1)
+    assert list(results) == ["active"]
+    results = scheduler.run()
+    assert list(results) == ["idle"]
+
+
+def test_scheduler_shares_time_between_sessions_without_deadlines():
+    clock = FakeClock()
+    scheduler = SessionScheduler()
+    for name in "abc":
+        interpreter = SignInterpreter(SlowProvider(clock, name=name), InterpreterConfig(segment_size=1), clock=clock)
+        scheduler.add_session(name, interpreter, active=True)
+    served = {name: 0 for name in "abc"}
+    for _ in range(20):
+        clock.now += 10
+        for name in "abc":
+            scheduler.submit(name, [clock.now])
+        for name, interps in scheduler.run(max_segments=2).items():
+            served[name] += len(interps)
+    assert sum(served.values()) == 40
+    assert max(served.values()) - min(served.values()) <= 1
+
+
+def test_scheduler_sheds_idle_sessions_under_global_budget():
+    clock = FakeClock()
+    idle = SignInterpreter(SlowProvider(clock), InterpreterConfig(segment_size=2), clock=clock)
+    active = SignInterpreter(SlowProvider(clock), InterpreterConfig(segment_size=2), clock=clock)
+    scheduler = SessionScheduler(SchedulerConfig(max_total_frames=6))
+    scheduler.add_session("idle", idle)
+    scheduler.add_session("active", active, active=True)
+    scheduler.submit("active", range(4))
+    scheduler.submit("idle", range(4))
+    assert scheduler.pending_frames <= 6
+    assert idle.stats.shed_frames == 2
+    assert active.stats.shed_frames == 0
+    assert scheduler.stats()["totals"]["shed_frames"] == 2
@@ -1,9 +1,14 @@
+import os
+
+import pytest
+
 from unison_io_sign.schemas import (
     AvatarInstructions,
     SignInterpretation,
     SignPresenceEvent,
     SigningOutput,
     VideoSegment,
+    next_segment_id,
 )
 
 
@@ -39,3 +44,54 @@ def test_interpretation_stub_factory():
     assert interp.intent == {"name": "open_app"}
     assert interp.raw_gloss == ["OPEN", "SETTINGS"]
     assert interp.segment_id == segment.segment_id
+
+
+def test_interpretation_stub_without_segment_gets_unique_ids():
+    first = SignInterpretation.from_stub(language="asl", text="a")
+    second = SignInterpretation.from_stub(language="asl", text="b")
+    assert first.segment_id != second.segment_id
+    assert first.segment_id != VideoSegment().segment_id
+    assert first.end_time_ms >= first.start_time_ms
+
+
+def test_segment_ids_are_uuid_shaped():
+    import uuid
+
+    parsed = uuid.UUID(VideoSegment().segment_id)
+    assert parsed.version == 4
+    assert parsed.variant == uuid.RFC_4122
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_children_get_distinct_segment_ids():
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # child
+        os.write(write_fd, next_segment_id().encode())
+        os._exit(0)
+    os.close(write_fd)
+    parent_id = next_segment_id()
+    os.waitpid(pid, 0)
+    with os.fdopen(read_fd, "rb") as f:
+        child_id = f.read().decode()
+    assert child_id
+    assert child_id != parent_id
+    assert child_id[:19] != parent_id[:19]
+
+
+def test_to_dict_copies_containers():
+    interp = SignInterpretation.from_stub(language="asl", text="open settings", gloss=["OPEN"])
+    interp.metadata["router"] = {"scores": {"asl": 0.9}}
+    data = interp.to_dict()
+    data["raw_gloss"].append("SETTINGS")
+    data["metadata"]["router"]["scores"]["asl"] = 0.1
+    assert interp.raw_gloss == ["OPEN"]
+    assert interp.metadata["router"]["scores"]["asl"] == 0.9
+
+
+def test_format_timestamp_is_iso_utc():
+    from unison_io_sign.schemas import format_timestamp
+
+    assert format_timestamp(1735689600) == "2025-01-01T00:00:00Z"
+    assert format_timestamp(1735689600.9) == "2025-01-01T00:00:00Z"
+    assert format_timestamp(1735689601) == "2025-01-01T00:00:01Z"